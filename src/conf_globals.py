@@ -1,8 +1,16 @@
+import os
+import sys
+
 G_LOG_LEVEL = 0
 VERSION: tuple = (0, 0, 16)
 HOST: str = "r0fld4nc3"
 APP_NAME: str = "PyGitDatBack"
 COMMIT_CUTOFF_DAYS = 360
 THREAD_TIMEOUT_SECONDS = 60
-MAX_CONCURRENT_TASKS = 3
+# Clones are network and disk bound, so go with 3/4 of the cores but never fewer than 4.
+# macOS is capped since many concurrent git processes run into its low open file limit.
+MAX_CONCURRENT_TASKS = max(4, (os.cpu_count() or 4) * 3 // 4)
+if sys.platform == "darwin":
+    MAX_CONCURRENT_TASKS = min(MAX_CONCURRENT_TASKS, 16)
 DRY_RUN = False
+TIMESTAMP_FORMAT = "yyyy-MM-dd HH:mm:ss" # QDateTime format of the last pulled timestamps
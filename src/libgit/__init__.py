@@ -2,4 +2,4 @@
 from .git import Repository
 
 # Methods
-from .git import parse_owner_name_from_url, validate_github_url, get_branches_and_commits, api_status, get_branches_shallow_clone
+from .git import parse_owner_name_from_url, validate_github_url, get_branches_and_commits, get_branches_and_commits_batch, api_status, get_branches_shallow_clone
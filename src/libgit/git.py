@@ -5,6 +5,9 @@ import shutil
 import requests
 import psutil
 import time
+import hashlib
+import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Union
 from urllib.parse import urlparse
@@ -20,6 +23,14 @@ logger = create_logger(__name__, G_LOG_LEVEL)
 API_GITHUB_NETLOC = "https://api.github.com"
 API_GITHUB_REPOS = f"{API_GITHUB_NETLOC}/repos"
 API_EXT_GITHUB_BRANCHES = "branches"
+API_GITHUB_GRAPHQL = f"{API_GITHUB_NETLOC}/graphql"
+GRAPHQL_BATCH_SIZE = 25 # Repositories per GraphQL request
+GITHUB_TOKEN_ENV = "GITHUB_TOKEN" # GraphQL does not allow anonymous requests
+GRAPHQL_REFS_PAGE_SIZE = 100 # Most refs GitHub returns per page
+API_TIMEOUT_SECONDS = 30 # Per request, a stalled request must not hang the caller for good
+
+_GRAPHQL_REFS_FIELDS = (f"refs(refPrefix: \"refs/heads/\", first: {GRAPHQL_REFS_PAGE_SIZE}, after: $after) "
+                        f"{{ nodes {{ name target {{ oid ... on Commit {{ committedDate }} }} }} pageInfo {{ hasNextPage endCursor }} }}")
 
 
 class Repository(git.Repo):
@@ -33,6 +44,7 @@ class Repository(git.Repo):
         self.head_name = ""
         self.repo_branches: list[git.RemoteReference] = list()
         self.active_branches: list[git.RemoteReference] = list()
+        self.branches_fetched: bool = True # False when the branch fetch after a shallow clone failed
 
         self.max_retries = 3
         self.retry_delay = 30 # seconds
@@ -44,7 +56,7 @@ class Repository(git.Repo):
         if not hasattr(self, "git_dir"):
             self.git_dir = None
 
-    def clone_from(self, dest: Union[Path, str], *args, **kwargs):
+    def clone_from(self, dest: Union[Path, str], *args, shallow: bool = False, branches: list = None, **kwargs):
         """`@Override`
         
         Override method to use to clone the designated GitHub URL to disk.
@@ -59,6 +71,10 @@ class Repository(git.Repo):
         * If :param:`branch` is specified, it will attempt to clone a branch from the repository
         and name the corresponding destination folder accordingly.
 
+        * If :param:`shallow` is `True`, only the latest commit is cloned (`--depth=1`).
+        Since that also limits the clone to a single branch, any :param:`branches` are
+        fetched afterwards with one `git fetch`.
+
         Attributes it uses/modifies:
 
         * :param:`cloned_to`
@@ -87,6 +103,9 @@ class Repository(git.Repo):
             sanitised_trail = kwargs.get("branch").split('/', 1)[-1].replace('/', '-') # Needs to be sanitised
             clone_dest = dest / sanitised_trail
 
+        if shallow:
+            kwargs.setdefault("depth", 1)
+
         # =================================
         #             CLONING
         # =================================
@@ -99,7 +118,7 @@ class Repository(git.Repo):
             backup_dir = self.set_backup_dir(clone_dest)
             
             # Clone the repo/branch
-            successful_clone, _ = self.__clone_from_basecls(self.url, clone_dest, args, kwargs)
+            successful_clone, _ = self.__clone_from_basecls(self.url, clone_dest, *args, **kwargs)
             
             # Try to remove the backup directory after successful clone
             if successful_clone:
@@ -114,7 +133,7 @@ class Repository(git.Repo):
                 # Set backup dir back
                 backup_dir.rename(clone_dest)
         else:
-            successful_clone, _ = self.__clone_from_basecls(self.url, clone_dest, args, kwargs)
+            successful_clone, _ = self.__clone_from_basecls(self.url, clone_dest, *args, **kwargs)
 
             if successful_clone:
                 self.cloned_to = clone_dest
@@ -122,12 +141,65 @@ class Repository(git.Repo):
                 super().__init__(str(clone_dest))
                 self.repo = self
 
+        self.branches_fetched = True
+        if successful_clone and shallow and branches:
+            self.branches_fetched = self.fetch_branches(branches, depth=kwargs.get("depth"))
+
         # Don't collect branch names if we're cloning a specific branch already
         # if not kwargs.get("branch", None):
             # self.collect_branches()
 
         return self
     
+    def get_clone_dest(self, dest: Union[Path, str]) -> Path:
+        """Returns the folder `clone_from(dest)` clones into, without touching the disk."""
+        dest = Path(dest).resolve()
+
+        if f"{self.name.lower()}" not in dest.name.lower():
+            dest = dest / self.name
+
+        return dest / self.head_name.replace('/', '-')
+
+    def get_remote_heads_fingerprint(self) -> str:
+        """Returns a digest of the remote's branch heads from a single `git ls-remote --heads`,
+        which changes whenever any branch is pushed to. Empty string if the remote could not be queried.
+        """
+        try:
+            heads = git.cmd.Git().ls_remote("--heads", self.url)
+        except Exception as e:
+            logger.error(f"[{self.name}] Unable to list remote heads: {e}")
+            return ""
+
+        return hashlib.sha1(heads.encode("utf-8")).hexdigest()
+
+    def fetch_branches(self, branches: list, depth: int = None) -> bool:
+        """Fetches the given remote branches into the cloned repository using a single
+        `git fetch` with one refspec per branch, instead of one round-trip per branch.
+
+        :return: `True` if the fetch succeeded.
+        """
+        if not self.repo:
+            logger.info(f"[{self.name}] Not cloned, nothing to fetch into")
+            return False
+
+        # Skip empty names
+        names = [str(b).strip() for b in branches]
+        refspecs = [f"+refs/heads/{name}:refs/remotes/origin/{name}" for name in names if name]
+        if not refspecs:
+            # Nothing to fetch is not a failure
+            return True
+
+        fetch_kwargs = {"depth": depth} if depth else {}
+
+        try:
+            logger.info(f"[{self.name}] Fetching {len(refspecs)} branches")
+            self.repo.git.fetch("origin", *refspecs, **fetch_kwargs)
+        except Exception as e:
+            logger.error(f"[{self.name}] Error fetching branches {branches}: {e}")
+            return False
+
+        return True
+
     def clone_branches(self, only_active=False) -> "Repository":
         if not self.repo_branches or not self.cloned_to or not self.repo:
             return
@@ -376,6 +448,7 @@ def _rmtree_on_error(func, path, exc_info):
         raise
 
 
+@lru_cache(maxsize=4096) # Same URLs get parsed over and over by the UI
 def parse_owner_name_from_url(url: str) -> Tuple[str, str]:
     logger.info(f"Parsing URL {url}")
     owner: str = ""
@@ -470,7 +543,14 @@ def _determine_max_workers(load_factor: float = 1.0, max_limit: int = None) -> i
 
     return max(1, optimal_workers)
 
-def get_branches_and_commits(repo) -> Tuple[int, dict]:
+def get_branches_and_commits(repo, cache_dir: Path = None) -> Tuple[int, dict]:
+    """Fetches the branches of a repository and their last commits from the GitHub REST API.
+
+    :param cache_dir: If given, the response is cached there along with its ETag. Later calls send
+        `If-None-Match` and on `304` return the cached information without fetching the commits again.
+    :return: `(status, info)`, status is `304` when the cached information is still current.
+    """
+    url = repo
     owner, repo = parse_owner_name_from_url(repo)
 
     # Endpoint API to list branches
@@ -479,9 +559,22 @@ def get_branches_and_commits(repo) -> Tuple[int, dict]:
 
     ret_info = {}
 
-    response = requests.get(api_url)
+    cache_file = None
+    cached = {}
+    headers = _github_auth_headers()
+    if cache_dir:
+        cache_file = Path(cache_dir) / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+        cached = _read_branches_cache(cache_file)
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+    response = requests.get(api_url, headers=headers, timeout=API_TIMEOUT_SECONDS)
     logger.info(f"Response Code: {response.status_code}")
     
+    if response.status_code == 304:
+        logger.info(f"Branches unchanged since last fetch, using cache {cache_file}")
+        return response.status_code, cached.get("info", {})
+
     if response.status_code == 200:
         branches_info = response.json()
 
@@ -497,12 +590,16 @@ def get_branches_and_commits(repo) -> Tuple[int, dict]:
                 }
 
             # Fetch commit details
-            commit_response = requests.get(last_commit_url)
+            commit_response = requests.get(last_commit_url, headers=_github_auth_headers(), timeout=API_TIMEOUT_SECONDS)
             if commit_response.status_code == 200:
                 commit_info = commit_response.json()
                 commit_date = commit_info["commit"]["committer"]["date"]
                 ret_info[branch_name]["last_commit_date"] = commit_date
 
+        etag = response.headers.get("ETag")
+        if cache_file and etag:
+            _write_branches_cache(cache_file, {"etag": etag, "info": ret_info})
+
     elif response.status_code == 403:
         logger.info(f"API rate limit exceeded")
 
@@ -510,6 +607,133 @@ def get_branches_and_commits(repo) -> Tuple[int, dict]:
 
     return response.status_code, ret_info
 
+def _github_auth_headers() -> dict:
+    """Returns the `Authorization` header for the token in `GITHUB_TOKEN`, empty if it is not set."""
+    token = os.getenv(GITHUB_TOKEN_ENV)
+    return {"Authorization": f"bearer {token}"} if token else {}
+
+def _read_branches_cache(cache_file: Path) -> dict:
+    try:
+        with open(cache_file, 'r', encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Unable to read branches cache {cache_file}: {e}")
+        return {}
+
+def _write_branches_cache(cache_file: Path, content: dict):
+    try:
+        os.makedirs(cache_file.parent, exist_ok=True)
+        with open(cache_file, 'w', encoding="utf-8") as f:
+            json.dump(content, f)
+    except Exception as e:
+        logger.warning(f"Unable to write branches cache {cache_file}: {e}")
+
+def get_branches_and_commits_batch(urls: list[str]) -> dict[str, Tuple[int, dict]]:
+    """Fetches the branches and last commits of many repositories with a few GraphQL requests instead of
+    one REST request per repository and branch.
+
+    Requires a token in the `GITHUB_TOKEN` environment variable. Repositories that could not be resolved
+    are left out of the result, for the caller to fall back to `get_branches_and_commits`.
+
+    :return: Mapping of URL to the same `(status, info)` pair returned by `get_branches_and_commits`.
+    """
+    headers = _github_auth_headers()
+    if not headers:
+        logger.info(f"No {GITHUB_TOKEN_ENV} set, skipping GraphQL batch")
+        return {}
+
+    ret = {}
+
+    for start in range(0, len(urls), GRAPHQL_BATCH_SIZE):
+        batch = urls[start:start + GRAPHQL_BATCH_SIZE]
+
+        # One aliased repository field per URL, owner and name passed as variables
+        params = ["$after: String"]
+        fields = []
+        variables = {"after": None}
+        for i, url in enumerate(batch):
+            variables[f"o{i}"], variables[f"n{i}"] = parse_owner_name_from_url(url)
+            params.append(f"$o{i}: String!, $n{i}: String!")
+            fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ {_GRAPHQL_REFS_FIELDS} }}")
+        query = f"query({', '.join(params)}) {{ {' '.join(fields)} }}"
+
+        try:
+            response = requests.post(API_GITHUB_GRAPHQL, json={"query": query, "variables": variables}, headers=headers,
+                                     timeout=API_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.error(f"GraphQL request failed: {e}")
+            continue
+
+        logger.info(f"GraphQL Response Code: {response.status_code}")
+        if response.status_code != 200:
+            continue
+
+        # Unresolved URLs fall back to REST, so a bad body must not end the caller
+        try:
+            data = response.json().get("data") or {}
+        except Exception as e:
+            logger.error(f"Invalid GraphQL response: {e}")
+            continue
+
+        for i, url in enumerate(batch):
+            repository = data.get(f"r{i}")
+            if not repository:
+                continue
+
+            owner, name = variables[f"o{i}"], variables[f"n{i}"]
+            nodes = list(repository["refs"]["nodes"])
+
+            # Only the first page of refs comes with the batch, page through the rest per repository
+            page_info = repository["refs"].get("pageInfo") or {}
+            if page_info.get("hasNextPage"):
+                nodes.extend(_graphql_remaining_refs(owner, name, page_info.get("endCursor"), headers))
+
+            ret_info = {}
+            for node in nodes:
+                target = node.get("target") or {}
+                last_commit_sha = target.get("oid", "")
+                ret_info[node["name"]] = {
+                    "last_commit_sha": last_commit_sha,
+                    "last_commit_url": f"{API_GITHUB_REPOS}/{owner}/{name}/commits/{last_commit_sha}",
+                    "last_commit_date": target.get("committedDate", "")
+                }
+
+            ret[url] = (200, ret_info)
+
+    logger.info(f"Resolved {len(ret)} of {len(urls)} repositories through GraphQL")
+
+    return ret
+
+def _graphql_remaining_refs(owner: str, name: str, after: str, headers: dict) -> list[dict]:
+    """Fetches the refs of a repository that come after the cursor `after`, one page per request.
+
+    :return: The ref nodes, as far as they could be fetched.
+    """
+    query = (f"query($o: String!, $n: String!, $after: String) "
+             f"{{ r: repository(owner: $o, name: $n) {{ {_GRAPHQL_REFS_FIELDS} }} }}")
+    nodes = []
+
+    while after:
+        try:
+            response = requests.post(API_GITHUB_GRAPHQL, json={"query": query, "variables": {"o": owner, "n": name, "after": after}},
+                                     headers=headers, timeout=API_TIMEOUT_SECONDS)
+            refs = response.json()["data"]["r"]["refs"] if response.status_code == 200 else None
+        except Exception as e:
+            logger.error(f"GraphQL request failed: {e}")
+            refs = None
+
+        if not refs:
+            logger.warning(f"[{owner}/{name}] Unable to fetch more branches, list truncated after {GRAPHQL_REFS_PAGE_SIZE + len(nodes)}")
+            break
+
+        nodes.extend(refs["nodes"])
+        page_info = refs.get("pageInfo") or {}
+        after = page_info.get("endCursor") if page_info.get("hasNextPage") else None
+
+    return nodes
+
 def get_branches_shallow_clone(url: str) -> dict:
     temp_dir = get_env_tempdir() / "pygitdatback" / "tempclone"
 
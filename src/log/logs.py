@@ -7,6 +7,11 @@ from conf_globals import HOST, APP_NAME
 LOG_FILE = get_os_env_config_folder() / HOST / APP_NAME / f"{APP_NAME}.log"
 print(f"{LOG_FILE=}")
 
+LOG_DATE_FORMAT = "%d-%m-%Y %H:%M:%S"
+
+# Shared by all handlers of all loggers
+_FORMATTER = logging.Formatter(f"[%(asctime)s] [%(levelname)s] [%(name)s] [%(funcName)s] %(message)s", datefmt=LOG_DATE_FORMAT)
+
 LEVELS = {
     0: logging.DEBUG,
     1: logging.INFO,
@@ -32,10 +37,8 @@ def create_logger(logger_name: str, level: int) -> logging.Logger:
     handler_stream = logging.StreamHandler()
     handler_file = logging.FileHandler(LOG_FILE)
 
-    formatter = logging.Formatter(f"[%(asctime)s] [%(levelname)s] [%(name)s] [%(funcName)s] %(message)s", 
-                                  datefmt="%d-%m-%Y %H:%M:%S")
-    handler_stream.setFormatter(formatter)
-    handler_file.setFormatter(formatter)
+    handler_stream.setFormatter(_FORMATTER)
+    handler_file.setFormatter(_FORMATTER)
 
     # Add the handlers if not present already
     if not any(isinstance(handler, logging.StreamHandler) for handler in logger.handlers):
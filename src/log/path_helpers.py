@@ -1,6 +1,8 @@
 import os
+from functools import lru_cache
 import platform
 from pathlib import Path
+from typing import Union
 
 WINDOWS = "windows"
 LINUX = "linux"
@@ -8,141 +10,161 @@ UNIX = "unix"
 DARWIN = "darwin"
 MAC = "mac"
 
+_WINDOWS_NAMES = frozenset({WINDOWS})
+_LINUX_NAMES = frozenset({LINUX, UNIX})
+_DARWIN_NAMES = frozenset({DARWIN, MAC})
+
+# The platform does not change while running, platform.system() can be slow on Windows
+_SYSTEM = platform.system().lower()
+_IS_WINDOWS = _SYSTEM in _WINDOWS_NAMES
+_IS_LINUX = _SYSTEM in _LINUX_NAMES
+_IS_DARWIN = _SYSTEM in _DARWIN_NAMES
+_HOME = Path.home()
+
+# Folder kinds resolved for the running system, so no helper falls back through another
+_WINDOWS_FOLDERS = {
+    "appdata": lambda: Path(os.getenv("appdata")),
+    "localappdata": lambda: Path(os.getenv("localappdata")),
+    "documents": lambda: get_home_folder() / "Documents",
+    "share": lambda: Path(os.getenv("localappdata")),
+    "local": lambda: Path(os.getenv("localappdata")),
+    "config": lambda: Path(os.getenv("localappdata"))
+}
+_UNIX_FOLDERS = {
+    "appdata": lambda: get_home_folder() / ".local" / "share",
+    "localappdata": lambda: get_home_folder() / ".local" / "share",
+    "documents": lambda: get_home_folder() / ".local" / "share",
+    "share": lambda: get_home_folder() / ".local" / "share",
+    "local": lambda: get_home_folder() / ".local",
+    "config": lambda: get_home_folder() / ".config"
+}
+_FOLDER_FN = _WINDOWS_FOLDERS if _IS_WINDOWS else _UNIX_FOLDERS
+
+
+@lru_cache(maxsize=None)
+def get_config_folder(kind: str) -> Path:
+    """Returns the folder of the given kind for the running system.
+
+    :param kind: One of `appdata`, `localappdata`, `documents`, `share`, `local` or `config`
+    """
+    return _FOLDER_FN[kind]()
+
+
 def win_get_appdata() -> Path:
-    if os_windows():
-        return Path(os.getenv("appdata"))
-    else:
-        return unix_get_share_folder()
+    return get_config_folder("appdata")
 
 
 def win_get_localappdata() -> Path:
-    if os_windows():
-        return Path(os.getenv("localappdata"))
-    else:
-        return unix_get_share_folder()
+    return get_config_folder("localappdata")
 
 
 def win_get_documents_folder() -> Path:
-    if os_windows():
-        return get_home_folder() / "Documents"
-    else:
-        return unix_get_share_folder()
+    return get_config_folder("documents")
 
 
 def unix_get_share_folder() -> Path:
-    if not os_windows():
-        return unix_get_local_folder() / "share"
-    else:
-        return win_get_localappdata()
+    return get_config_folder("share")
 
 
 def unix_get_local_folder() -> Path:
-    if not os_windows():
-        return get_home_folder() / ".local"
-    else:
-        return win_get_localappdata()
+    return get_config_folder("local")
 
 
 def unix_get_config_folder() -> Path:
-    if not os_windows():
-        return get_home_folder() / ".config"
-    else:
-        return win_get_localappdata()
+    return get_config_folder("config")
 
 
 def get_home_folder() -> Path:
-    return Path(os.path.expanduser('~'))
+    return _HOME
 
 
+@lru_cache(maxsize=None)
 def get_env_tempdir() -> Path:
     if os_windows():
         _tempdir = win_get_localappdata() / "Temp"
     else:
         _tempdir = unix_get_share_folder() / "temp"
 
-    # Ensure path exists
+    # Ensure path exists, once as the result is cached
     ensure_paths(_tempdir)
 
     return _tempdir
 
 
+# Keyed by system(), Linux and MacOS write to user-writable locations, like ~/.local/share
+_CONFIG_FOLDER_FN = {
+    WINDOWS: win_get_localappdata,
+    LINUX: unix_get_share_folder,
+    UNIX: unix_get_share_folder,
+    DARWIN: unix_get_share_folder,
+    MAC: unix_get_share_folder
+}
+
+
 def get_os_env_config_folder() -> Path:
-    if os_windows():
-        _config_folder = win_get_localappdata()
-    elif os_linux():
-        _config_folder = unix_get_share_folder()
-    elif os_darwin():
-        # Write to user-writable locations, like ~/.local/share
-        _config_folder = unix_get_share_folder()
-    else:
-        _config_folder = Path.cwd()
+    _config_folder = _CONFIG_FOLDER_FN.get(_SYSTEM, Path.cwd)()
 
     ensure_paths(_config_folder)
 
     return _config_folder
 
 
-def ensure_paths(to_path: Path):
-    if isinstance(to_path, Path):
-        if not to_path.exists():
-            if to_path.suffix:
-                # It's a file
-                os.makedirs(to_path.parent, exist_ok=True)
-                with open(to_path, 'w') as f:
-                    if to_path.suffix == ".json":
-                        f.write('{}')
-                    else:
-                        f.write('')
-            else:
-                # It's a directory
-                os.makedirs(to_path, exist_ok=True)
-    elif isinstance(to_path, str):
-        if not os.path.exists(to_path):
-            if str(to_path).rpartition('.')[-1]:
-                # We have a file
-                os.makedirs(to_path.rpartition('.')[0])
-                with open(to_path, 'w') as f:
-                    if to_path.endswith(".json") == ".json":
-                        f.write('{}')
-                    else:
-                        f.write('')
-            else:
-                os.makedirs(to_path)
-
-    return Path(to_path)
+def ensure_paths(to_path: Union[Path, str]) -> Path:
+    """Creates the folder, or the file and its parent folder if the path has a suffix. `.json` files start as `{}`."""
+    p = Path(to_path)
+
+    # Try to create first instead of checking, the paths usually exist already
+    folder = p.parent if p.suffix else p
+    try:
+        folder.mkdir()
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        folder.mkdir(parents=True, exist_ok=True)
 
+    if p.suffix:
+        try:
+            with open(p, 'x', encoding="utf-8") as f:
+                f.write('{}' if p.suffix == ".json" else '')
+        except FileExistsError:
+            pass
 
+    return p
+
+
+@lru_cache(maxsize=None)
 def get_system_drive() -> Path:
-    _drive = os.getenv("SystemDrive")
     if os_windows():
-        _drive += "/"
-    else:
-        _drive = get_home_folder()
-    return Path(_drive)
+        return Path(os.environ["SystemDrive"] + "/")
 
+    return get_home_folder()
 
-def get_temp_dir() -> Path:
-    if os_windows():
-        tmp_dir = Path(os.path.expandvars("%TEMP%"))
-    elif os_linux() or os_darwin():
-        tmp_dir = Path("/tmp")
-    else:
-        tmp_dir = Path(os.path.expanduser('~'))
 
-    return tmp_dir
+_TEMP_DIR_FN = {
+    WINDOWS: lambda: Path(os.path.expandvars("%TEMP%")),
+    LINUX: lambda: Path("/tmp"),
+    UNIX: lambda: Path("/tmp"),
+    DARWIN: lambda: Path("/tmp"),
+    MAC: lambda: Path("/tmp")
+}
+
+
+@lru_cache(maxsize=None)
+def get_temp_dir() -> Path:
+    return _TEMP_DIR_FN.get(_SYSTEM, lambda: Path(os.path.expanduser('~')))()
 
 
 def os_linux() -> bool:
-    return system() in [LINUX, UNIX]
+    return _IS_LINUX
 
 
 def os_darwin() -> bool:
-    return system() in [DARWIN, MAC]
+    return _IS_DARWIN
 
 
 def os_windows() -> bool:
-    return system() in [WINDOWS]
+    return _IS_WINDOWS
 
 
 def system() -> str:
-    return platform.system().lower()
+    return _SYSTEM
@@ -21,7 +21,7 @@ def launch_ui() -> bool:
     reset_log_file()
     logger.info("Launching GUI application")
     app = GitDatBackUI()
-    app.show()
+    raise SystemExit(app.show())
 
 def launch_no_ui() -> bool:
     reset_log_file()
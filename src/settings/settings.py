@@ -1,10 +1,12 @@
 import os
 import sys
 import json
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Union
 
-from conf_globals import G_LOG_LEVEL, HOST, APP_NAME
+from conf_globals import G_LOG_LEVEL, HOST, APP_NAME, MAX_CONCURRENT_TASKS
 from utils import get_os_env_config_folder, get_home_folder
 from log import create_logger
 
@@ -27,6 +29,10 @@ class Settings:
     KEY_BRANCHES = "branches"
     KEY_WIN_SIZE = "window_size"
     KEY_REPO_LOC = "locations"
+    KEY_REMOTE_HEAD = "remote_head"
+    KEY_MAX_CONCURRENT_TASKS = "max_concurrent_tasks"
+    KEY_USE_PROCESS_POOL = "use_process_pool"
+    KEY_SHALLOW_CLONE = "shallow_clone"
 
     def __init__(self):
         self.settings = {
@@ -38,12 +44,21 @@ class Settings:
             self.KEY_SCHEDULED_TIME: "",
             self.KEY_SERVICE_SET: False,
             self.KEY_REPOS: {},
-            self.KEY_WIN_SIZE: ""
+            self.KEY_WIN_SIZE: "",
+            self.KEY_MAX_CONCURRENT_TASKS: 0,
+            self.KEY_USE_PROCESS_POOL: False,
+            self.KEY_SHALLOW_CLONE: False
         }
         self._config_file_name = "pygitdatback-settings.json"
         self.config_dir = Path(CONFIG_FOLDER)
         self.config_file = Path(CONFIG_FOLDER) / self._config_file_name
 
+        # Guards in-memory updates coming from worker threads
+        self._lock = threading.Lock()
+
+        # Set while inside `batch`, defers `save_config` to the end of the block
+        self._suspend_save = False
+
         logger.info(f"{CONFIG_FOLDER=}")
 
     def set_save_root_dir(self, p: Union[str, Path]):
@@ -104,6 +119,43 @@ class Settings:
 
         # self.save_config()
 
+    def stage_repo(self, repo_url, locations: list = None, remote_head: str = None, **kwargs):
+        """Thread-safe in-memory update of a repository, see `save_repo` for the keyword arguments.
+
+        Nothing is written to disk until `save_config` is called.
+        """
+        with self._lock:
+            self.save_repo(repo_url, **kwargs)
+            if locations:
+                self.add_repo_locations(repo_url, locations)
+            if remote_head is not None:
+                self.set_last_remote_head(repo_url, remote_head)
+
+    def get_last_remote_head(self, repo_url) -> str:
+        """Returns the remote state recorded at the last successful pull of the repository."""
+        repo = self.settings[self.KEY_REPOS].get(str(repo_url).strip())
+        if not repo:
+            return ""
+
+        return repo.get(self.KEY_REMOTE_HEAD, "")
+
+    def set_last_remote_head(self, repo_url, remote_head: str):
+        repo = self.settings[self.KEY_REPOS].get(str(repo_url).strip())
+        if not repo:
+            logger.info(f"No repository present: {repo_url}")
+            return
+
+        repo[self.KEY_REMOTE_HEAD] = remote_head
+
+    def save_repos_bulk(self, entries: list[tuple[str, bool, str, list]]):
+        """Applies `save_repo` for many repositories in one go. Nothing is written to disk until `save_config` is called.
+
+        :param entries: `(repo_url, do_pull, timestamp, branches)` tuples.
+        """
+        with self._lock:
+            for repo_url, do_pull, timestamp, branches in entries:
+                self.save_repo(repo_url, do_pull, timestamp=timestamp, branches=branches)
+
     def remove_repo(self, repo_url) -> bool:
         repo_url = str(repo_url).strip()
 
@@ -132,16 +184,81 @@ class Settings:
         logger.info(f"{width_height=}")
         return width_height
 
-    def save_config(self) -> Path:
+    def get_max_concurrent_tasks(self) -> int:
+        """Returns the configured number of concurrent pulls, or the system default when unset (`0`)."""
+        try:
+            max_tasks = int(self.settings.get(self.KEY_MAX_CONCURRENT_TASKS, 0))
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid {self.KEY_MAX_CONCURRENT_TASKS} value. Using default {MAX_CONCURRENT_TASKS}")
+            max_tasks = 0
+
+        if max_tasks <= 0:
+            return MAX_CONCURRENT_TASKS
+
+        return max_tasks
+
+    def get_use_process_pool(self) -> bool:
+        """Whether scheduled pulls run in separate processes instead of threads. Off by default.
+
+        Only worth it if cloning turns out to be held back by the GIL. Each process also
+        opens its own git processes and file handles, which macOS' low open file limit does not like.
+        """
+        return bool(self.settings.get(self.KEY_USE_PROCESS_POOL, False))
+
+    def get_shallow_clone(self) -> bool:
+        """Whether repositories are cloned with only their latest commit (`--depth=1`). Off by default."""
+        return bool(self.settings.get(self.KEY_SHALLOW_CLONE, False))
+
+    def set_shallow_clone(self, shallow: bool):
+        self.settings[self.KEY_SHALLOW_CLONE] = shallow
+        logger.info(f"Set shallow clone to: {shallow}")
+
+    @contextmanager
+    def batch(self, in_background: bool = False):
+        """Groups settings changes so they are written to disk once, when the block exits.
+
+        Calls to `save_config` inside the block are deferred. Nested blocks save with the outermost one.
+
+        :param in_background: Passed on to the final `save_config`.
+        """
+        if self._suspend_save:
+            yield self
+            return
+
+        self._suspend_save = True
+        try:
+            yield self
+        finally:
+            self._suspend_save = False
+            self.save_config(in_background=in_background)
+
+    def save_config(self, in_background: bool = False) -> Path:
+        """Writes the settings to the config file.
+
+        :param in_background: Write the file on a separate thread. The settings are serialized before returning,
+            so later changes do not race with the write. The thread is not a daemon, the interpreter waits for it on exit.
+        """
+        if self._suspend_save:
+            logger.debug("Save deferred until end of batch")
+            return self.config_file
+
+        content = json.dumps(self.settings, indent=2)
+
+        if in_background:
+            threading.Thread(target=self._write_config, args=(content,), name="SaveConfig").start()
+        else:
+            self._write_config(content)
+
+        return self.config_file
+
+    def _write_config(self, content: str):
         if self.config_dir == '' or not Path(self.config_dir).exists():
             os.makedirs(self.config_dir, exist_ok=True)
             logger.info(f"Generated config folder {self.config_dir}")
 
         with open(self.config_file, 'w', encoding="utf-8") as config_file:
-            config_file.write(json.dumps(self.settings, indent=2))
+            config_file.write(content)
             logger.info(f"Saved config {self.config_file}")
-
-        return self.config_file
     
     def get_background_service_status(self) -> bool:
         return self.settings.get(self.KEY_SERVICE_SET)
@@ -181,6 +298,12 @@ class Settings:
     def get_scheduled_time(self) -> str:
         return self.settings.get(self.KEY_SCHEDULED_TIME, "")
     
+    def get_scheduled_time_parts(self) -> tuple[str, str]:
+        """Returns the scheduled time as an `(hour, minute)` pair, empty strings if not set."""
+        hour, _, rest = self.get_scheduled_time().partition(':')
+        minute = rest.partition(':')[0]
+        return hour, minute
+
     def set_scheduled_time(self, time: str) -> str:
         logger.info(f"Set Scheduled Time to {time}")
         self.settings[self.KEY_SCHEDULED_TIME] = time
@@ -1,8 +1,9 @@
-from .aligned_widget import AlignedWidget
 from .worker_signals import WorkerSignals
 from .clone_repo_task import CloneRepoTask
+from .callable_task import CallableTask
 from .task_queue import TaskQueue
 
 from .table_entry import TableEntry
+from .repo_table_model import RepoTableModel
 from .alert_dialog import AlertDialog
 from .service_config_window import ServiceConfigWindow
@@ -0,0 +1,29 @@
+from PySide6.QtCore import QRunnable
+
+from .worker_signals import WorkerSignals
+from conf_globals import G_LOG_LEVEL
+from log import create_logger
+
+logger = create_logger(__name__, G_LOG_LEVEL)
+
+class CallableTask(QRunnable):
+    """Runs a callable on the thread pool and emits its return value through `signals.result`."""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def __str__(self) -> str:
+        return getattr(self.fn, "__name__", repr(self.fn))
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+            self.signals.result.emit(result)
+            self.signals.finished.emit(str(self))
+        except Exception as e:
+            logger.error(f"Error running task {self}: {e}")
+            self.signals.error.emit(str(self), str(e))
@@ -3,35 +3,44 @@ from time import sleep
 import secrets
 
 from .worker_signals import WorkerSignals
+from libgit import Repository
 from conf_globals import G_LOG_LEVEL, DRY_RUN
 from log import create_logger
 
 logger = create_logger(__name__, G_LOG_LEVEL)
 
 class CloneRepoTask(QRunnable):
-    def __init__(self, repo, path, entry):
+    def __init__(self, url: str, path, entry, shallow: bool = False, branches: list = None):
         super().__init__()
-        self.repo = repo
+        self.url = url
         self.path = path
         self.entry = entry
+        self.shallow = shallow
+        self.branches = branches
         self.signals = WorkerSignals()
 
+    def __str__(self) -> str:
+        return self.url
+
     def run(self):
         try:
             if not DRY_RUN:
-                logger.info(f"Cloning repository {self.repo.url} into {self.path}")
-                self.repo.clone_from(self.path)
+                logger.info(f"Cloning repository {self.url} into {self.path}")
+                # Built here so the UI thread only hands over the URL
+                repo = Repository(self.url)
+                repo.clone_from(self.path, shallow=self.shallow, branches=self.branches)
             else:
-                logger.info(f"Dry run repository {self.repo.url} into {self.path}")
+                logger.info(f"Dry run repository {self.url} into {self.path}")
                 
                 _sleep = secrets.choice(range(1, 11))
-                logger.debug(f"[{self.repo.url}] Sleeping for {_sleep}")
-                self.entry.set_status(f"{self.entry.status_fetching} ({_sleep})")
+                logger.debug(f"[{self.url}] Sleeping for {_sleep}")
+                # Not set on the entry here, the model must only be touched from the UI thread
+                self.signals.status.emit(self.url, f"{self.entry.status_fetching} ({_sleep})")
 
                 if _sleep == 7:
                     raise Exception("Test exception, hit 7")
                 sleep(_sleep)
-            self.signals.finished.emit(self.repo.url)
+            self.signals.finished.emit(self.url)
         except Exception as e:
-            logger.error(f"Error cloning repository {self.repo.url}: {e}")
-            self.signals.error.emit(self.repo.url, str(e))
+            logger.error(f"Error cloning repository {self.url}: {e}")
+            self.signals.error.emit(self.url, str(e))
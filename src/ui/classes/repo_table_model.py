@@ -0,0 +1,142 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from conf_globals import G_LOG_LEVEL
+from log import create_logger
+
+from .table_entry import TableEntry
+
+logger = create_logger(__name__, G_LOG_LEVEL)
+
+
+class RepoTableModel(QAbstractTableModel):
+    """Table model over a list of `TableEntry`. The view only asks for the cells it draws."""
+    HEADERS = ["Pull", "URL", "Branches", "Last Pulled", "Status"]
+    COL_PULL, COL_URL, COL_BRANCHES, COL_TIMESTAMP, COL_STATUS = range(len(HEADERS))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.entries: list[TableEntry] = []
+        self._rows: dict[TableEntry, int] = {} # Row of each entry, entries hash by identity
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.entries)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        entry = self.entries[index.row()]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            if col == self.COL_URL:
+                return entry.url
+            if col == self.COL_BRANCHES:
+                return entry.get_branches_text()
+            if col == self.COL_TIMESTAMP:
+                return entry.timestamp
+            if col == self.COL_STATUS:
+                return entry.status
+        elif role == Qt.CheckStateRole and col == self.COL_PULL:
+            return Qt.Checked if entry.do_pull else Qt.Unchecked
+        elif role == Qt.TextAlignmentRole:
+            if col in (self.COL_URL, self.COL_BRANCHES):
+                return Qt.AlignLeft | Qt.AlignVCenter
+            return Qt.AlignCenter
+
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        if not index.isValid() or index.column() != self.COL_PULL or role != Qt.CheckStateRole:
+            return False
+
+        self.entries[index.row()].do_pull = Qt.CheckState(value) == Qt.Checked
+        self.dataChanged.emit(index, index, [role])
+
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == self.COL_PULL:
+            flags |= Qt.ItemIsUserCheckable
+
+        return flags
+
+    def add_entries(self, entries: list[TableEntry]):
+        """Appends `entries` as new rows, in a single insert."""
+        if not entries:
+            return
+
+        first_row = len(self.entries)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(entries) - 1)
+        for row, entry in enumerate(entries, first_row):
+            entry.set_change_callback(self.entry_changed)
+            self._rows[entry] = row
+        self.entries.extend(entries)
+        self.endInsertRows()
+
+    def remove_rows(self, rows: list[int]) -> list[TableEntry]:
+        """Removes the given rows, consecutive rows are removed together.
+
+        :return: The removed entries.
+        """
+        removed = []
+
+        # Bottom up so the remaining row numbers stay valid
+        rows = sorted(set(rows), reverse=True)
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            i += 1
+            while i < len(rows) and rows[i] == first - 1:
+                first = rows[i]
+                i += 1
+
+            self.beginRemoveRows(QModelIndex(), first, last)
+            block = self.entries[first:last + 1]
+            del self.entries[first:last + 1]
+            self.endRemoveRows()
+
+            for entry in block:
+                entry.set_change_callback(None)
+                self._rows.pop(entry, None)
+            removed.extend(block)
+
+        # Rows after the first removed one have moved up
+        if rows:
+            for row in range(rows[-1], len(self.entries)):
+                self._rows[self.entries[row]] = row
+
+        return removed
+
+    def entry_changed(self, entry: TableEntry):
+        """Redraws the row of `entry`."""
+        row = self._rows.get(entry)
+        if row is None:
+            logger.debug(f"Entry not in model: {entry.url}")
+            return
+
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def entries_changed(self, entries: list[TableEntry]):
+        """Redraws the rows of `entries` at once, for when their fields were changed directly."""
+        rows = [self._rows[entry] for entry in entries if entry in self._rows]
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), len(self.HEADERS) - 1))
+
+    def refresh(self):
+        """Redraws all rows, for when entries were changed through their fields directly."""
+        if self.entries:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.entries) - 1, len(self.HEADERS) - 1))
@@ -12,23 +12,25 @@ logger = create_logger(__name__, G_LOG_LEVEL)
 
 
 class ServiceConfigWindow(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, settings: Settings = None):
         super().__init__(parent)
 
         self.setWindowTitle("Service Settings")
         self.setModal(True) # Blocks interaction with parent window
         self.resize(QSize(300, 200))
 
-        self.settings = Settings()
-        self.settings.load_config()
+        # Reuse the caller's already loaded settings if given
+        if settings is None:
+            settings = Settings()
+            settings.load_config()
+        self.settings = settings
 
         self.selected_type = self.settings.get_schedule_type()
         self.selected_week_day = self.settings.get_scheduled_week_day()
         self.selected_month_day = self.settings.get_scheduled_month_day()
         self.selected_month = self.settings.get_scheduled_month()
         self.selected_time = self.settings.get_scheduled_time()
-        self.selected_hour = self.selected_time.split(':')[0]
-        self.selected_min = self.selected_time.split(':')[1]
+        self.selected_hour, self.selected_min = self.settings.get_scheduled_time_parts()
 
         logger.debug(f"{self.selected_type=}")
         logger.debug(f"{self.selected_time=}")
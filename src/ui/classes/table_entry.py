@@ -1,97 +1,105 @@
-from PySide6.QtWidgets import (
-    QWidget, QHBoxLayout, QCheckBox, QLabel
-)
-from PySide6.QtCore import QDateTime, Qt
+from dataclasses import dataclass, field
+from typing import Callable, ClassVar
 
-from conf_globals import G_LOG_LEVEL
-from log import create_logger
+from PySide6.QtCore import QDateTime
 
-from . import AlignedWidget
+from conf_globals import G_LOG_LEVEL, TIMESTAMP_FORMAT
+from log import create_logger
+from libgit import parse_owner_name_from_url
 
 logger = create_logger(__name__, G_LOG_LEVEL)
 
 
-class TableEntry(QWidget):
-    def __init__(self, url: str):
-        super().__init__()
+@dataclass(eq=False)
+class TableEntry:
+    """A repository row of the table. Only data, drawing it is left to `RepoTableModel`.
 
-        self.pull_checkbox = QCheckBox()
-        self.pull_checkbox_widget = AlignedWidget(self.pull_checkbox)
-        self.pull_checkbox.setChecked(True) # Default pull to true
+    The setters notify the model the entry belongs to, assigning the fields directly does not.
+    """
+    url: str
+    do_pull: bool = True # Default pull to true
+    branches: list = field(default_factory=list)
+    timestamp: str = "n/a"
+    status: str = ""
 
-        self.branches_to_pull = []
-        
-        self.url_label = QLabel(url.strip())
-        self.url_label_widget = AlignedWidget(self.url_label, alignment=Qt.AlignLeft, margins=(5, 0, 0, 0))
+    status_fetching: ClassVar[str] = "Fetching..."
+    status_finished: ClassVar[str] = "Done"
 
-        self.branches_label = QLabel()
-        self.branches_label_widget = AlignedWidget(self.branches_label, alignment=Qt.AlignLeft, margins=(5, 0, 0, 0))
-        
-        self.timestamp_label = QLabel("n/a")
-        self.timestamp_widget = AlignedWidget(self.timestamp_label)
+    _owner_name: tuple = field(default=None, init=False, repr=False) # Parsed from the URL on first use
+    _on_changed: Callable = field(default=None, init=False, repr=False) # Set by the model holding the entry
+    _branches_text: str = field(default=None, init=False, repr=False) # Joined branches, built when first drawn
 
-        self.status_label = QLabel()
-        self.status_widget = AlignedWidget(self.status_label)
-        self.status_fetching = "Fetching..."
-        self.status_finished = "Done"
+    def __post_init__(self):
+        self.url = self.url.strip()
 
-        layout = QHBoxLayout()
-        layout.addWidget(self.pull_checkbox_widget)
-        layout.addWidget(self.url_label)
-        layout.addWidget(self.timestamp_widget)
-        layout.addWidget(self.status_widget)
+    def set_change_callback(self, callback: Callable):
+        """Sets the function called with the entry whenever a setter changes it."""
+        self._on_changed = callback
 
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(10)
-
-        self.setLayout(layout)
+    def _changed(self):
+        self._branches_text = None
+        if self._on_changed:
+            self._on_changed(self)
 
     def get_pull(self) -> bool:
-        return self.pull_checkbox.isChecked()
+        return self.do_pull
 
     def set_pull(self, state: bool):
-        self.pull_checkbox.setChecked(state)
-
-    def get_timestamp(self) -> str:
-        return self.timestamp_label.text()
+        self.do_pull = state
+        self._changed()
 
     def set_timestamp_now(self):
-        """Sets the current timestamp on the timestamp_item."""
-        _timestamp = QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm:ss")
-        self.timestamp_label.setText(_timestamp)
-        logger.info(f"Set timestamp {_timestamp} of entry {self.get_url()}")
+        """Sets the current timestamp on the entry."""
+        _timestamp = QDateTime.currentDateTime().toString(TIMESTAMP_FORMAT)
+        self.set_timestamp(_timestamp)
 
     def get_url(self) -> str:
-        return self.url_label.text()
+        return self.url
 
     def set_url(self, url):
-        former_url = self.url_label.text()
-        self.url_label.setText(url)
+        former_url = self.url
+        self.url = url
+        self._owner_name = None
+        self._changed()
         logger.info(f"Set new URL: {url} for former {former_url}")
 
+    def get_owner_name(self) -> tuple[str, str]:
+        """Returns the `(owner, name)` pair of the repository URL."""
+        if self._owner_name is None:
+            self._owner_name = parse_owner_name_from_url(self.get_url())
+        return self._owner_name
+
     def get_timestamp(self) -> str:
-        return self.timestamp_label.text()
+        return self.timestamp
 
     def set_timestamp(self, timestamp: str):
-        """Sets the timestamp on the timestamp_item."""
-        self.timestamp_label.setText(timestamp)
-        logger.info(f"Set timestamp '{timestamp}' of widget {self.timestamp_label} [{self.get_url()}]")
+        """Sets the timestamp on the entry."""
+        self.timestamp = timestamp
+        self._changed()
+        logger.info(f"Set timestamp '{timestamp}' [{self.get_url()}]")
 
     def get_status(self) -> str:
-        return self.status_label.text()
+        return self.status
 
     def set_status(self, status: str):
-        """Sets the status on the status_item."""
-        self.status_label.setText(status)
-        logger.info(f"Set status '{status}' of widget {self.status_label} [{self.get_url()}]")
+        """Sets the status on the entry."""
+        self.status = status
+        self._changed()
+        logger.info(f"Set status '{status}' [{self.get_url()}]")
 
     def get_branches(self) -> list:
-        return self.branches_to_pull
+        return self.branches
+
+    def get_branches_text(self) -> str:
+        """Returns the branches as shown in the table, joined once until they change."""
+        if self._branches_text is None:
+            self._branches_text = ', '.join(self.branches)
+        return self._branches_text
 
     def set_branches(self, branches_to_set: list):
-        self.branches_to_pull = branches_to_set
-        self.branches_label.setText(', '.join(self.branches_to_pull))
-        logger.info(f"Set new branches: {self.branches_to_pull} for {self.url_label.text()}")
+        self.branches = branches_to_set
+        self._changed()
+        logger.info(f"Set new branches: {self.branches} for {self.get_url()}")
 
     def props(self) -> dict:
         """Returns the properties that comprise the entry for a saveable format
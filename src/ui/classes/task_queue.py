@@ -1,105 +1,148 @@
-from queue import Queue
+from collections import deque
 import threading
-from time import sleep
-from PySide6.QtCore import QRunnable, QThread, QThreadPool, QObject
+from PySide6.QtCore import QRunnable, QThread, QThreadPool, QObject, Qt
 
 from .clone_repo_task import CloneRepoTask
+from .callable_task import CallableTask
 from conf_globals import G_LOG_LEVEL, MAX_CONCURRENT_TASKS
 from log import create_logger
 
 logger = create_logger(__name__, G_LOG_LEVEL)
 
+_SENTINEL = object() # Queued by stop() to wake up and end process_tasks
 
-class TaskQueue(QObject):
-    _task_lock = threading.Lock()
-    _ongoing_tasks: int = 0
-    MAX_CONCURRENT_TASKS: int = MAX_CONCURRENT_TASKS
 
-    def __init__(self):
+class TaskQueue(QObject):
+    def __init__(self, max_concurrent_tasks: int = MAX_CONCURRENT_TASKS):
+        """
+        :param max_concurrent_tasks: How many tasks may run at once, usually `Settings.get_max_concurrent_tasks`.
+        """
         super().__init__()
-        self.queue = Queue()
+        self.MAX_CONCURRENT_TASKS: int = max_concurrent_tasks
+        self._task_lock = threading.Lock()
+        self._ongoing_tasks: int = 0
+        self._dq = deque()
+        self._cv = threading.Condition()
         self.thread_pool = QThreadPool()
+        # Enough threads for the allowed tasks, the pool defaults to the CPU count
+        self.thread_pool.setMaxThreadCount(max(self.MAX_CONCURRENT_TASKS, self.thread_pool.maxThreadCount()))
         self.is_running = True
+
+        # Set whenever a concurrency slot may have been freed
+        self._slot_available = threading.Event()
+        self._slot_available.set()
         
         self.worker_thread = QThread()
         self.moveToThread(self.worker_thread)
         self.worker_thread.started.connect(self.process_tasks)
         self.worker_thread.start()
 
-    @classmethod
-    def get_ongoing_tasks(cls) -> int:
-        with cls._task_lock:
-            return cls._ongoing_tasks
+    def get_ongoing_tasks(self) -> int:
+        with self._task_lock:
+            return self._ongoing_tasks
         
-    @classmethod
-    def increment_ongoing_tasks(cls) -> bool:
-        with cls._task_lock:
-            if cls._ongoing_tasks < cls.MAX_CONCURRENT_TASKS:
-                cls._ongoing_tasks += 1
+    def increment_ongoing_tasks(self) -> bool:
+        with self._task_lock:
+            if self._ongoing_tasks < self.MAX_CONCURRENT_TASKS:
+                self._ongoing_tasks += 1
                 return True
             return False
         
-    @classmethod
-    def decrement_ongoing_tasks(cls):
-        with cls._task_lock:
-            if cls._ongoing_tasks > 0:
-                cls._ongoing_tasks -= 1
-
-    def add_task(self, task: QRunnable | CloneRepoTask):
-        self.queue.put(task)
-        logger.debug(f"Put task: {task.entry.get_url()}")
+    def decrement_ongoing_tasks(self):
+        with self._task_lock:
+            if self._ongoing_tasks > 0:
+                self._ongoing_tasks -= 1
+
+    def on_task_complete(self, *_):
+        self.decrement_ongoing_tasks()
+        self._slot_available.set()
+        logger.debug(f"Task completed. Remaining active tasks: {self.get_ongoing_tasks()}")
+
+    def add_task(self, task: QRunnable | CloneRepoTask | CallableTask):
+        with self._cv:
+            self._dq.append(task)
+            self._cv.notify()
+        logger.debug(f"Put task: {task}")
+
+    def submit(self, fn, *args, on_done=None, on_error=None, **kwargs) -> CallableTask:
+        """Queues `fn(*args, **kwargs)` to run on the thread pool.
+
+        :param on_done: Called with the return value of `fn`. Runs in the thread of its owner if it's a `QObject` method.
+        :param on_error: Called with the task name and the error message if `fn` raises. Runs like `on_done`.
+        """
+        task = CallableTask(fn, *args, **kwargs)
+        if on_done:
+            task.signals.result.connect(on_done)
+        if on_error:
+            task.signals.error.connect(on_error)
+
+        self.add_task(task)
+
+        return task
+
+    def _acquire_slot(self) -> bool:
+        # Clear before trying so a completion in between wakes the consumer up again
+        self._slot_available.clear()
+        return self.increment_ongoing_tasks()
 
     def process_tasks(self):
-        while self.is_running:
-            if self.queue.qsize() == 0:
-                sleep(1) # Prevent busy waiting
-                continue
+        while True:
+            with self._cv:
+                while not self._dq:
+                    self._cv.wait()
+
+                task = self._dq.popleft()
+
+            if task is _SENTINEL:
+                break
+
+            # Sleep until a running task frees up a slot
+            while self.is_running and not self._acquire_slot():
+                logger.debug(f"Max concurrent tasks reached ({self.MAX_CONCURRENT_TASKS}). Tasks in queue: {len(self._dq)}")
+                self._slot_available.wait()
+
+            if not self.is_running:
+                break
 
             try:
-                # Peek without taking
-                task = self.queue.queue[0]
-
-                # Try to increment the task counter
-                if self.increment_ongoing_tasks():
-                    task = self.queue.get(timeout=1)
-                    logger.info(f"Got task {task.entry.get_url()}! Ongoing: {self.get_ongoing_tasks()}")
-
-                    # Wrap run method to handle completion
-                    original_run = task.run
-                    def wrapped_run():
-                        try:
-                            original_run()
-                        except Exception as e:
-                            logger.error(f"Error in wrapped run: {e}")
-                        finally:
-                            self.decrement_ongoing_tasks()
-                            logger.debug(f"Task completed. Remaining active tasks: {self.get_ongoing_tasks()}")
-
-                    task.run = wrapped_run
-
-                    # Start the task
-                    self.thread_pool.start(task)
-                    self.queue.task_done()
-                    sleep(0.5)
-                else:
-                    # If we can't process now, wait before trying again
-                    logger.debug(f"Max concurrent tasks reached ({self.MAX_CONCURRENT_TASKS}). Tasks in queue: {self.queue.qsize()}")
-                    sleep(1)
-                continue
+                logger.info(f"Got task {task}! Ongoing: {self.get_ongoing_tasks()}")
+
+                # Release the slot once the task is done. Direct connection since this object's thread is busy in this loop
+                task.signals.finished.connect(self.on_task_complete, Qt.DirectConnection)
+                task.signals.error.connect(self.on_task_complete, Qt.DirectConnection)
+
+                # Start the task
+                self.thread_pool.start(task)
             except Exception as e:
                 logger.error(f"Error processing task: {e}")
-                self.decrement_ongoing_tasks()
+                self.on_task_complete()
 
-    def stop(self):
+    def stop(self, timeout_ms: int = -1) -> bool:
+        """Stops starting queued tasks and waits for the running ones.
+
+        :param timeout_ms: Longest wait for the running tasks, `-1` waits for as long as they take.
+        :return: `True` if all running tasks finished in time.
+        """
         logger.info("Stopping Task Queue")
         self.is_running = False
+        self._slot_available.set() # Release a consumer waiting for a slot
+        with self._cv:
+            # Jump the queue so pending tasks are not started
+            self._dq.appendleft(_SENTINEL)
+            self._cv.notify_all()
         self.worker_thread.quit()
         self.worker_thread.wait()
 
+        # Let already running tasks finish
+        done = self.thread_pool.waitForDone(timeout_ms)
+        if not done:
+            logger.warning(f"Tasks still running after {timeout_ms} ms")
+
+        return done
+
     def cleanup(self):
         self.stop()
 
-    @classmethod
-    def reset_task_counter(cls):
-        with cls._task_lock:
-            cls._ongoing_tasks = 0
+    def reset_task_counter(self):
+        with self._task_lock:
+            self._ongoing_tasks = 0
@@ -3,4 +3,6 @@ from PySide6.QtCore import QObject, Signal
 class WorkerSignals(QObject):
     finished = Signal(str)
     error = Signal(str, str)
+    status = Signal(str, str)
+    result = Signal(object)
     
\ No newline at end of file
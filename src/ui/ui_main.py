@@ -1,50 +1,70 @@
 import sys
+import hashlib
+import logging
+import threading
 from pathlib import Path
 from typing import List
 import shutil
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
-    QLabel, QTableWidget, QSizePolicy, QInputDialog, QDialog, QFileDialog, 
+    QLabel, QTableView, QAbstractItemView, QSizePolicy, QInputDialog, QDialog, QFileDialog, 
     QMessageBox
 )
-from PySide6.QtCore import QSize, QDateTime, QRunnable
+from PySide6.QtCore import QSize, QRect, QDateTime, QTimer, Signal
 
 from .utils import get_screen_info
-from conf_globals import G_LOG_LEVEL, VERSION, MAX_CONCURRENT_TASKS, DRY_RUN
+from conf_globals import G_LOG_LEVEL, VERSION, MAX_CONCURRENT_TASKS, DRY_RUN, TIMESTAMP_FORMAT
 from log import create_logger
 from settings import Settings
 from libgit import Repository
-from libgit import validate_github_url, get_branches_and_commits, parse_owner_name_from_url
+from libgit import validate_github_url, get_branches_and_commits, get_branches_and_commits_batch, parse_owner_name_from_url
 import systemd
 
-from .classes import TaskQueue, TableEntry, ServiceConfigWindow, CloneRepoTask, AlertDialog
+from .classes import TaskQueue, TableEntry, RepoTableModel, ServiceConfigWindow, CloneRepoTask, AlertDialog
 
 logger = create_logger(__name__, G_LOG_LEVEL)
 
+_QAPP = None # Shared QApplication across UI instances
 
-class BranchTask(QRunnable):
-    def __init__(self, url, callback):
-        super().__init__()
-        self.url = url
-        self.callback = callback
+# Long-lived executor for pull_repos_no_ui, created on first use
+_PULL_EXECUTOR: ThreadPoolExecutor = None
+_PULL_EXECUTOR_LOCK = threading.Lock()
 
-    def run(self):
-        try:
-            result = get_branches_and_commits(self.url)
-            self.callback(result)
-        except Exception as e:
-            logger.error(f"Error obtaining branches and commits for repository {self.url}: {e}")
+
+def get_pull_executor(max_workers: int = MAX_CONCURRENT_TASKS) -> ThreadPoolExecutor:
+    """Returns the shared pull executor. `max_workers` only applies when it is first created."""
+    global _PULL_EXECUTOR
+    with _PULL_EXECUTOR_LOCK:
+        if _PULL_EXECUTOR is None:
+            _PULL_EXECUTOR = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pull")
+        return _PULL_EXECUTOR
+
+
+def shutdown_pull_executor():
+    global _PULL_EXECUTOR
+    with _PULL_EXECUTOR_LOCK:
+        if _PULL_EXECUTOR is not None:
+            _PULL_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+            _PULL_EXECUTOR = None
 
 
 class GitDatBackUI(QWidget):
-    APP_VERSION_STR = 'v' + '.'.join([str(x) for x in VERSION])
+    APP_VERSION_STR = f"v{'.'.join(map(str, VERSION))}"
+
+    # Emitted from the branch prefetch worker thread, consumed on the UI thread
+    branchesReady = Signal(str, object)
+    # Emitted from the removal executor with the directories that could not be removed
+    directoriesRemoved = Signal(object)
+    LOAD_CHUNK_SIZE = 500 # Saved repositories inserted into the table per event loop pass
+    SHUTDOWN_WAIT_MS = 30000 # Longest wait on close for running clones
 
     def __init__(self):
-        if not QApplication.instance():
-            self.app = QApplication(sys.argv)
-        else:
-            self.app = QApplication.instance()
+        global _QAPP
+        _QAPP = _QAPP or QApplication.instance() or QApplication(sys.argv)
+        self.app = _QAPP
 
         super().__init__()
 
@@ -54,6 +74,15 @@ class GitDatBackUI(QWidget):
         window_size = self.settings.get_window_size()
         logger.info(f"{window_size=}")
 
+        # Screen metrics, cached until the window or primary screen changes
+        self._screen_info = None
+        self._tracking_screen = False
+        self.app.primaryScreenChanged.connect(self._invalidate_screen_info)
+
+        # Make sure the state is saved even if the app quits without closing the window
+        self._settings_flushed = False
+        self.app.aboutToQuit.connect(self._flush_settings)
+
         self.repos_backup_path = self.settings.get_save_root_dir(fallback=(Path(__name__).parent.parent / "tests/gitclone/repos").resolve())
         
         # Set app constraints
@@ -65,10 +94,29 @@ class GitDatBackUI(QWidget):
             self.resize(QSize(window_size[0], window_size[1]))
 
         # Tasks
-        self.task_queue = TaskQueue()
+        self.task_queue = TaskQueue(self.settings.get_max_concurrent_tasks())
 
         # Tracking
-        self.entries: List[TableEntry] = []
+        self.table_model = RepoTableModel()
+        self.entries: List[TableEntry] = self.table_model.entries # Rows are added and removed through the model
+        self._entries_by_url: dict[str, TableEntry] = {} # Mirrors self.entries for lookups by URL
+
+        # Clone completions waiting to be applied to the table, see _queue_completion
+        self._completed_queue = deque()
+        self._drain_scheduled = False
+        self._outstanding = 0 # Clone tasks started by pull_repos that have not reported back yet
+
+        # Status line text waiting to be shown, see tell
+        self._pending_status = ""
+        self._status_flush_scheduled = False
+
+        # Branch fetches resolve off the UI thread and come back through this signal
+        self.branchesReady.connect(self._on_branches_ready)
+        self._branch_cache_dir = self.settings.get_config_dir() / "cache" / "branches" # ETag cache of branch fetches
+
+        # Own executor for disk removals, so closing the app finishes them instead of dropping them with the task queue
+        self._removal_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="remove")
+        self.directoriesRemoved.connect(self._on_directories_removed)
 
         # Main layout
         main_layout = QVBoxLayout()
@@ -89,10 +137,10 @@ class GitDatBackUI(QWidget):
         self.info_label = QLabel()
         
         # Main Table
-        self.entry_table = QTableWidget(0, 5)
-        self.entry_table.setHorizontalHeaderLabels(["Pull", "URL", "Branches", "Last Pulled", "Status"])
+        self.entry_table = QTableView()
+        self.entry_table.setModel(self.table_model)
         self.entry_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.entry_table.cellDoubleClicked.connect(self.handle_cell_doubleclick)
+        self.entry_table.doubleClicked.connect(self.handle_cell_doubleclick)
         self.entry_table.horizontalHeader().setStretchLastSection(True)
         self.entry_table.setColumnWidth(0, 40)
         self.entry_table.setColumnWidth(1, 400)
@@ -100,7 +148,7 @@ class GitDatBackUI(QWidget):
         self.entry_table.setColumnWidth(3, 175)
         self.entry_table.setColumnWidth(4, 100)
         # Selection behaviour
-        self.entry_table.setSelectionBehavior(QTableWidget.SelectRows) # Select full rows
+        self.entry_table.setSelectionBehavior(QAbstractItemView.SelectRows) # Select full rows
 
         # Actions Layout - Where we put button actions
         self.actions_layout = QHBoxLayout()
@@ -145,6 +193,7 @@ class GitDatBackUI(QWidget):
         self.backup_path_input.setPlaceholderText("Root folder for repositories...")
         self.backup_path_input.setText(str(self.repos_backup_path))
         self.backup_path_input.editingFinished.connect(self.set_backup_path)
+        self._last_backup_input_text = None # Input already resolved by set_backup_path
 
         # Backup Path Pick Button
         self.pick_backup_path_button = QPushButton("Pick")
@@ -170,6 +219,21 @@ class GitDatBackUI(QWidget):
         self.unregister_service_button = QPushButton("Unregister Service")
         self.unregister_service_button.clicked.connect(self.unregister_background_service)
 
+        # Buttons toggled while a task is running
+        self._task_state_buttons = [
+            self.submit_button,
+            self.set_selection_selected_button,
+            self.set_selection_deselected_button,
+            self.set_all_selected_button,
+            self.set_all_deselected_button,
+            self.remove_selected_button,
+            self.pick_backup_path_button,
+            self.service_options_button,
+            self.register_service_button,
+            self.unregister_service_button,
+            self.pull_button
+        ]
+
         # Add widgets to input layout
         input_layout.addWidget(self.url_input)
         input_layout.addWidget(self.submit_button)
@@ -215,13 +279,27 @@ class GitDatBackUI(QWidget):
             return
         
         repos = self.settings.get_repos()
+        missing_branches = []
+        entries = []
 
         for repo_url, info in repos.items():
             do_pull = info.get(Settings.KEY_DO_PULL)
             timestamp = info.get(Settings.KEY_LAST_PULLED)
             branches = info.get(Settings.KEY_BRANCHES)
-            
-            self.add_to_table(repo_url, do_pull, timestamp, branches=branches)
+
+            entries.append(self._create_entry(repo_url, do_pull, timestamp, branches=branches))
+
+            if not branches:
+                missing_branches.append(repo_url)
+
+        # Looked up by URL right away, rows are inserted in chunks so the window can paint in between
+        for entry in entries:
+            self._entries_by_url[entry.get_url()] = entry
+        self._insert_entries_chunked(entries)
+
+        logger.info(f"Loaded {len(repos)} saved repositories")
+
+        self.prefetch_branches(missing_branches)
 
         self.tell("Status: Ready")
 
@@ -247,73 +325,115 @@ class GitDatBackUI(QWidget):
         entry = self.add_to_table(url, True, "n/a")
 
         # Save to settings
-        self.settings.save_repo(url, entry.pull_checkbox.isChecked())
+        self.settings.save_repo(url, entry.get_pull())
 
-        # branch_task = BranchTask(url, lambda res: self._update_entry_branches(entry, res))
-        # self.task_queue.add_task(branch_task)
-
-        # entry.branches_label.setText("Fecthing...")
+        # Same concurrent path as the startup prefetch, result comes back through branchesReady
+        self.prefetch_branches([url])
 
         self.url_input.clear()
 
     def add_to_table(self, url: str, do_pull: bool, timestamp: str = "", branches: list = []) -> TableEntry:
-        entry = TableEntry(url)
+        entry = self._create_entry(url, do_pull, timestamp, branches=branches)
+        self._add_entries([entry])
 
-        row_pos = self.entry_table.rowCount()
-        self.entry_table.insertRow(row_pos)
+        logger.info(f"Added entry: {url}")
+        self.tell(f"Added entry: {url}")
 
-        self.entry_table.setCellWidget(row_pos, 0, entry.pull_checkbox_widget)
-        self.entry_table.setCellWidget(row_pos, 1, entry.url_label)
-        self.entry_table.setCellWidget(row_pos, 2, entry.branches_label_widget)
-        self.entry_table.setCellWidget(row_pos, 3, entry.timestamp_widget)
-        self.entry_table.setCellWidget(row_pos, 4, entry.status_widget)
+        return entry
 
-        # Handle pull checkbox
-        entry.set_pull(do_pull)
+    def _create_entry(self, url: str, do_pull: bool, timestamp: str = "", branches: list = []) -> TableEntry:
+        entry = TableEntry(url, do_pull=do_pull)
 
         # Handle timestamp
         if timestamp:
-            entry.set_timestamp(timestamp)
+            entry.timestamp = timestamp
 
         # Handle branches
         if branches:
-            entry.set_branches(branches)
+            entry.branches = branches
 
-        self.entries.append(entry)
+        return entry
 
-        logger.info(f"Added entry: {url}")
-        self.tell(f"Added entry: {url}")
+    def _add_entries(self, entries: List[TableEntry]):
+        self.table_model.add_entries(entries)
+        for entry in entries:
+            self._entries_by_url[entry.get_url()] = entry
 
-        return entry
+    def _insert_entries_chunked(self, entries: List[TableEntry]):
+        self.table_model.add_entries(entries[:self.LOAD_CHUNK_SIZE])
+
+        remaining = entries[self.LOAD_CHUNK_SIZE:]
+        if remaining:
+            QTimer.singleShot(0, lambda: self._insert_entries_chunked(remaining))
+
+    def prefetch_branches(self, urls: list[str]):
+        """Fetches branch information for the given URLs concurrently without blocking the UI.
+
+        Results are delivered through `branchesReady` so that widgets are only touched from the UI thread.
+        """
+        if not urls:
+            return
+
+        logger.info(f"Prefetching branches for {len(urls)} repositories")
+        threading.Thread(target=self._fetch_branches_worker, args=(urls,), daemon=True).start()
+
+    def _fetch_branches_worker(self, urls: list[str]):
+        # Batched GraphQL first, whatever it could not resolve goes through REST
+        resolved = get_branches_and_commits_batch(urls)
+        for url, result in resolved.items():
+            self.branchesReady.emit(url, result)
+
+        urls = [url for url in urls if url not in resolved]
+
+        if not urls:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.settings.get_max_concurrent_tasks()) as executor:
+            future_to_url = {executor.submit(get_branches_and_commits, url, self._branch_cache_dir): url for url in urls}
+
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                try:
+                    self.branchesReady.emit(url, future.result())
+                except Exception as e:
+                    logger.error(f"Error obtaining branches and commits for repository {url}: {e}")
+
+    def _on_branches_ready(self, url: str, result):
+        entry = self._entries_by_url.get(url)
+        if entry:
+            self._update_entry_branches(entry, result)
 
     def _update_entry_branches(self, entry, result):
         # TODO: When we are finally saving to a file, check if there are branches saved before we pull from the api
 
         logger.info(f"Update Entry {entry} with {result}")
-        branches = []
 
         status = result[0]
         branch_info = result[1]
 
-        if status != 200:
+        if status == 304 and entry.get_branches():
+            # Unchanged on the remote, keep what the entry already shows
+            return
+
+        if status not in (200, 304):
+            # Report it, but keep the branches. They are saved and would be taken as real names
             code = str(status)
             if status == 403:
                 code += " (Rate limited)"
             elif status == 404:
                 code += " (Not found)"
-            branches.append(code)
-        else:
-            for branch_name, branch_info in branch_info.items():
-                branches.append(branch_name)
+            entry.set_status(f"Branches: {code}")
+            self.tell(f"Unable to fetch branches of {entry.get_url()}: {code}")
+            return
 
-        entry.set_branches(branches)
+        entry.set_branches(list(branch_info))
 
-    def handle_cell_doubleclick(self, row, col):
-        clickable_cols = [1, 2]
+    def handle_cell_doubleclick(self, index):
+        row, col = index.row(), index.column()
+        clickable_cols = [RepoTableModel.COL_URL, RepoTableModel.COL_BRANCHES]
         
         if col in clickable_cols:
             if col == clickable_cols[0]:
-                item = self.entry_table.item(row, col)
                 entry_item = self.entries[row]
                 entry_url = entry_item.get_url()
                 prefilled = entry_url
@@ -331,10 +451,11 @@ class GitDatBackUI(QWidget):
                     new_url = input_dialog.textValue()
                     if validate_github_url(new_url):
                         entry_item.set_url(new_url)
+                        self._entries_by_url.pop(entry_url, None)
+                        self._entries_by_url[entry_item.get_url()] = entry_item
                         logger.info(f"Edited {entry_url} to {new_url}")
                         self.tell(f"Edited {entry_url} to {new_url}")
             elif col == clickable_cols[1]:
-                item = self.entry_table.item(row, col)
                 entry_item = self.entries[row]
                 entry_url = entry_item.get_url()
                 entry_branches = entry_item.get_branches()
@@ -350,7 +471,7 @@ class GitDatBackUI(QWidget):
                 input_dialog.resize(400, 200)
 
                 if input_dialog.exec_() == QDialog.Accepted:
-                    branches = [b.strip() for b in input_dialog.textValue().split(',')]
+                    branches = [b for b in (x.strip() for x in input_dialog.textValue().split(',')) if b]
                     entry_item.set_branches(branches)
                     logger.info(f"Updated branches of {entry_url}: {branches}")
                     self.tell(f"Updated branches of {entry_url.split('/')[-1]}: {branches}")
@@ -361,12 +482,10 @@ class GitDatBackUI(QWidget):
             yield entry
 
     def entry_exists(self, url: str) -> bool:
-        for entry_widget in self.iter_entries():
-            logger.debug(f"{entry_widget=}")
-            if entry_widget.url_label.text() == url:
-                logger.info(f"{url} already in list of entries.")
-                return True
-        
+        if url in self._entries_by_url:
+            logger.info(f"{url} already in list of entries.")
+            return True
+
         return False
     
     def remove_selected_entries(self):
@@ -384,7 +503,7 @@ class GitDatBackUI(QWidget):
         for count, index in enumerate(selected):
             entry = self.entries[index.row()]
             url = entry.get_url()
-            _, name = parse_owner_name_from_url(url)
+            _, name = entry.get_owner_name()
 
             if url:
                 urls_to_remove.append(url)
@@ -429,8 +548,13 @@ class GitDatBackUI(QWidget):
         logger.debug(f"{persist=}")
 
         if remove_from_disk:
+            delete_targets: list[Path] = []
             for url in urls_to_remove:
-                repo_locations = self.settings.get_repo_locations(url)
+                owner, name = parse_owner_name_from_url(url)
+                name_backup = f"backup-{name}"
+
+                # Copy, the list belongs to the settings
+                repo_locations = list(self.settings.get_repo_locations(url))
                 # Extend make unique and list of Pathlib paths
                 for p in persist:
                     if str(p) not in repo_locations:
@@ -438,38 +562,31 @@ class GitDatBackUI(QWidget):
                 repo_locations = [Path(loc) for loc in repo_locations]
 
                 for loc_path in repo_locations:
-                    owner, name = parse_owner_name_from_url(url)
-                    backup = loc_path / f"backup-{name}"
+                    backup = loc_path / name_backup
                     clone = loc_path / name
 
                     logger.debug(f"{backup=}")
                     logger.debug(f"{clone=}")
 
-                    if backup.exists():
-                        logger.info(f"Attempting to remove backup directory {backup}")
-                        try:
-                            shutil.rmtree(backup)
-                            logger.info(f"Removed backup directory {backup}")
-                        except Exception as e:
-                            logger.error(f"Error removing backup directory {backup}: {e}")
-                    
-                    if clone.exists():
-                        logger.info(f"Attempting to remove clone directory {clone}")
-                        try:
-                            shutil.rmtree(clone)
-                            logger.info(f"Removed clone directory {clone}")
-                        except Exception as e:
-                            logger.error(f"Error removing clone directory {clone}: {e}")
+                    delete_targets.extend((backup, clone))
+
+            # Deleting can take a while on slow or network drives, keep it off the UI thread
+            self.tell(f"Removing {len(urls_to_remove)} repositories from disk")
+            future = self._removal_executor.submit(remove_directories, delete_targets, self.settings.get_max_concurrent_tasks())
+            future.add_done_callback(lambda f: self.directoriesRemoved.emit(f.result()))
         
         # Remove from UI
-        for index in sorted(selected, reverse=True):
-            entry_to_remove = self.entries[index.row()]
+        for entry_to_remove in self.table_model.remove_rows([index.row() for index in selected]):
             entry_url = entry_to_remove.get_url()
 
             self.settings.remove_repo(entry_url)
+            self._entries_by_url.pop(entry_url, None)
 
-            self.entries.remove(entry_to_remove)
-            self.entry_table.removeRow(index.row())
+    def _on_directories_removed(self, failed: list):
+        if failed:
+            self.tell(f"Unable to remove {len(failed)} directories from disk, see log for details")
+        else:
+            self.tell("Removed from disk")
 
     def set_selection_selected(self):
         selected_indices = [n.row() for n in self.entry_table.selectionModel().selectedRows()]
@@ -492,21 +609,27 @@ class GitDatBackUI(QWidget):
         self.tell("Deselected selection.")
 
     def set_all_selected(self):
-        for entry in self.iter_entries():
-            entry.set_pull(True)
+        self._set_all_pull(True)
 
         self.tell("Selected all.")
 
     def set_all_deselected(self):
-        for entry in self.iter_entries():
-            entry.set_pull(False)
+        self._set_all_pull(False)
 
         self.tell("Deselected all.")
 
+    def _set_all_pull(self, state: bool):
+        # Set the fields directly and redraw the table once
+        for entry in self.iter_entries():
+            entry.do_pull = state
+
+        self.table_model.refresh()
+
     def pick_backup_path(self):
         choice = QFileDialog.getExistingDirectory(self, "Select root folder", dir=str(self.repos_backup_path))
 
         if choice:
+            self.backup_path_input.setText(choice)
             self.set_backup_path()
         else:
             logger.info(f"User aborted backup path selection.")
@@ -514,33 +637,43 @@ class GitDatBackUI(QWidget):
     def set_backup_path(self):
         choice = self.backup_path_input.text()
 
-        if choice:
-            folder_path = Path(self.backup_path_input.text()).resolve()
+        # editingFinished also fires on focus loss, nothing to do if the text did not change
+        if choice and choice != self._last_backup_input_text:
+            folder_path = Path(choice).resolve(strict=False)
+            self._last_backup_input_text = str(folder_path)
             self.backup_path_input.setText(str(folder_path))
             self.repos_backup_path = folder_path
             logger.info(f"Backup path: {folder_path}")
 
     def tell(self, what: str):
-        self.info_label.setText(what.strip())
+        # Several calls in the same event loop pass only repaint the label once, with the latest text
+        self._pending_status = what.strip()
+
+        if not self._status_flush_scheduled:
+            self._status_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_status)
+
+    def _flush_status(self):
+        self._status_flush_scheduled = False
+        self.info_label.setText(self._pending_status)
 
     def pull_repos(self):
         self.set_buttons_state_while_task(False)
 
-        repos = []
+        if logger.isEnabledFor(logging.DEBUG):
+            for entry in self.iter_entries():
+                logger.debug(f"url={entry.get_url()} is_checked={entry.get_pull()}")
 
-        for entry in self.iter_entries():
-            is_checked = entry.get_pull()
-            url = entry.get_url()
-            
-            logger.debug(f"{url=}")
-            logger.debug(f"{is_checked=}")
-            
-            if is_checked:
-                repos.append((Repository(url), entry))
-                entry.set_status(entry.status_fetching)
+        repos = [entry for entry in self.iter_entries() if entry.get_pull()]
+
+        # Set the fields directly and redraw the rows once
+        for entry in repos:
+            entry.status = entry.status_fetching
+        self.table_model.entries_changed(repos)
 
         if not repos:
             self.tell("Nothing is checked.")
+            self.set_buttons_state_while_task(True)
             return
         
         if not DRY_RUN:
@@ -548,124 +681,156 @@ class GitDatBackUI(QWidget):
         else:
             self.tell(f"[DRY_RUN] Cloning {len(repos)} repositories")
 
-        for repo, entry in repos:
-            clone_task = CloneRepoTask(repo, self.repos_backup_path, entry)
+        shallow = self.settings.get_shallow_clone()
+
+        for entry in repos:
+            clone_task = CloneRepoTask(entry.get_url(), self.repos_backup_path, entry, shallow=shallow, branches=list(entry.get_branches()))
             logger.debug(f"Task {entry.get_url()}")
 
             # Connect the signals
             clone_task.signals.finished.connect(self.on_clone_success)
             clone_task.signals.error.connect(self.on_clone_error)
+            clone_task.signals.status.connect(self.on_clone_status)
 
             self.task_queue.add_task(clone_task)
+            self._outstanding += 1
 
         # self.set_buttons_state_while_task(True)
 
     @staticmethod
     def pull_repos_no_ui():
         logger.warning("Pull Repos lacks full implementation.")
-        repos: list[Repository] = []
+        jobs: list[tuple] = []
 
         settings = Settings()
         settings.load_config()
         saved_repos = settings.get_repos()
 
+        save_to = settings.get_save_root_dir(fallback=(Path(__name__).parent.parent / "tests/gitclone/repos").resolve())
+        logger.info(f"Cloning to root directory: {str(save_to)}")
+
+        shallow = settings.get_shallow_clone()
+
         logger.info("Iterating saved repos...")
         for url, info in saved_repos.items():
             logger.info(f"{url}")
             logger.info(f"{info=}")
             if info.get(settings.KEY_DO_PULL, False):
-                repos.append(Repository(url))
+                # Plain values so the job can also be sent to a process pool
+                jobs.append((url, info.get(settings.KEY_DO_PULL), list(info.get(settings.KEY_BRANCHES, [])), save_to, shallow,
+                             settings.get_last_remote_head(url)))
                 logger.info(f"Collected repo {url}")
 
-        save_to = settings.get_save_root_dir(fallback=(Path(__name__).parent.parent / "tests/gitclone/repos").resolve())
-        logger.info(f"Cloning to root directory: {str(save_to)}")
+        max_workers = settings.get_max_concurrent_tasks()
+        use_process_pool = settings.get_use_process_pool()
+        if use_process_pool:
+            logger.info(f"Using process pool with {max_workers} workers")
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            executor = get_pull_executor(max_workers)
 
-        # Function to clone a repository and update the settings
-        def clone_and_update_repo(repo: Repository):
-            repo.clone_from(save_to)
-            url = repo.url
-            do_pull = saved_repos[url].get(settings.KEY_DO_PULL)
-            timestamp = QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm:ss")
-            branches = saved_repos[url].get(settings.KEY_BRANCHES, [])
-            settings.save_repo(url, do_pull=do_pull, timestamp=timestamp, branches=branches)
-            # Add to repo locations
-            settings.add_repo_locations(url, save_to)
-            logger.info(f"Finished processing {url}")
-
-        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TASKS) as executor:
-            future_to_repo = {executor.submit(clone_and_update_repo, repo): repo for repo in repos}
-
-            for future in as_completed(future_to_repo):
-                repo = future_to_repo[future]
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Error pulling repository: {repo.url}: {e}")
+        # Keep a bounded number of submissions in flight and top up as they complete
+        pipeline = 2 * max_workers
+        jobs_iter = iter(jobs)
+        inflight = {}
+
+        try:
+            while True:
+                for job in islice(jobs_iter, pipeline - len(inflight)):
+                    inflight[executor.submit(clone_and_update_repo, *job)] = job[0]
+
+                if not inflight:
+                    break
+
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = inflight.pop(future)
+                    try:
+                        url, do_pull, branches, timestamp, remote_head = future.result()
+                        # Staged in memory only, written once after all repos are done
+                        settings.stage_repo(url, do_pull=do_pull, timestamp=timestamp, branches=branches, locations=save_to,
+                                            remote_head=remote_head)
+                        logger.info(f"Finished processing {url}")
+                    except Exception as e:
+                        logger.error(f"Error pulling repository: {url}: {e}")
+        finally:
+            if use_process_pool:
+                executor.shutdown()
+            else:
+                shutdown_pull_executor()
         
         settings.save_config()
         logger.info("Pull Repos No UI finished")
 
-    def set_button_state(self,button_widget: QPushButton, state: bool):
-        button_widget.setEnabled(state)
-
     def set_buttons_state_while_task(self, state: bool):
         logger.info(f"Set buttons state {state}")
-        self.set_button_state(self.submit_button, state)
-        self.set_button_state(self.set_selection_selected_button, state)
-        self.set_button_state(self.set_selection_deselected_button, state)
-        self.set_button_state(self.set_all_selected_button, state)
-        self.set_button_state(self.set_all_deselected_button, state)
-        self.set_button_state(self.remove_selected_button, state)
-        self.set_button_state(self.pick_backup_path_button, state)
-        self.set_button_state(self.service_options_button, state)
-        self.set_button_state(self.register_service_button, state)
-        self.set_button_state(self.unregister_service_button, state)
-        self.set_button_state(self.pull_button, state)
+        # Repaint once after all buttons are toggled
+        self.setUpdatesEnabled(False)
+        try:
+            for button in self._task_state_buttons:
+                button.setEnabled(state)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def on_clone_success(self, repo_url):
         logger.info(f"Cloning completed for: {repo_url}")
+        self._queue_completion(repo_url, None)
 
-        for entry in self.iter_entries():
-            if entry.get_url() == repo_url:
-                entry.set_timestamp_now()
-                entry.set_status(entry.status_finished)
+    def on_clone_status(self, repo_url, status):
+        entry = self._entries_by_url.get(repo_url)
+        if entry:
+            entry.set_status(status)
 
-        # Add to repo locations
-        self.settings.add_repo_locations(repo_url, self.repos_backup_path)
-
-        # Check if all done
-        if self.check_if_all_completed():
-            self.tell("Cloning completed")
-            self.set_buttons_state_while_task(True)
-                
     def on_clone_error(self, repo_name, error_msg):
         # logger.error(f"Error cloning repository {repo_name}: {error_msg}")
-        self.tell(f"Error cloning {repo_name}: {error_msg}")
+        self._queue_completion(repo_name, error_msg)
 
-        for entry in self.iter_entries():  
-            if entry.url_label.text() == repo_name:
-                entry.set_status(f"Error: {error_msg}")
+    def _queue_completion(self, repo_url: str, error_msg: str):
+        # Bursts of completions are applied together in one pass
+        self._completed_queue.append((repo_url, error_msg))
 
-        # Check if all done
-        if self.check_if_all_completed():
-            self.tell("Cloning completed")
-            self.set_buttons_state_while_task(True)
-        
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            QTimer.singleShot(50, self._drain_completions)
 
-    def check_if_all_completed(self):
-        missing = False
-        for entry in self.iter_entries():
-            if entry.get_pull() and entry.status_fetching.lower() in entry.get_status().lower():
-                missing = True
-                break
+    def _drain_completions(self):
+        self._drain_scheduled = False
 
-        if not missing:
-            return True
+        # Set the fields directly and redraw the changed rows once
+        changed = []
+        timestamp = QDateTime.currentDateTime().toString(TIMESTAMP_FORMAT)
 
-        return False
+        while self._completed_queue:
+            repo_url, error_msg = self._completed_queue.popleft()
+            entry = self._entries_by_url.get(repo_url)
+            self._outstanding = max(0, self._outstanding - 1)
+
+            if entry:
+                changed.append(entry)
+
+            if error_msg is None:
+                if entry:
+                    entry.timestamp = timestamp
+                    entry.status = entry.status_finished
+
+                # Add to repo locations
+                self.settings.add_repo_locations(repo_url, self.repos_backup_path)
+            else:
+                self.tell(f"Error cloning {repo_url}: {error_msg}")
+
+                if entry:
+                    entry.status = f"Error: {error_msg}"
+
+        self.table_model.entries_changed(changed)
+
+        # Check if all done
+        if self._outstanding == 0:
+            self.tell("Cloning completed")
+            self.set_buttons_state_while_task(True)
 
     def show_service_options_dialog(self):
-        service_dialog = ServiceConfigWindow(self)
+        service_dialog = ServiceConfigWindow(self, settings=self.settings)
         result = service_dialog.exec()
 
         # Handle results
@@ -689,59 +854,104 @@ class GitDatBackUI(QWidget):
         week_day = self.settings.get_scheduled_week_day()
         time = self.settings.get_scheduled_time()
 
-        if week_day or time:
-            logger.info(f"Want to register service with custom schedule: {schedule_type} {week_day} - {time}")
-            success, status = systemd.register_service(schedule_type=schedule_type, week_day=week_day, month=month, month_day=month_day, time=time)
-        else:
-            logger.info(f"Want to register service with default schedule")
-            success, status = systemd.register_service()
-        if success:
-            clipboard = self.app.clipboard()
-            clipboard.setText(status)
-            AlertDialog("Command copied to the clipboard. Please run it in your preferred Terminal application.", title="Set Background Service")
+        logger.info(f"Want to register service schedule: {schedule_type or 'default'} {week_day or 'default'} - {time or 'default'}")
+
+        # Unset values fall back to register_service's defaults
+        schedule = {"schedule_type": schedule_type, "week_day": week_day, "month": month, "month_day": month_day, "time": time}
+        schedule = {key: value for key, value in schedule.items() if value}
+
+        # systemd work runs on the task queue, the result comes back on the UI thread
+        self.task_queue.submit(systemd.register_service, **schedule, on_done=self._on_service_command_ready,
+                               on_error=self._on_service_command_error)
+
+    def unregister_background_service(self):
+        self.task_queue.submit(systemd.unregister_service, on_done=self._on_service_command_ready,
+                               on_error=self._on_service_command_error)
 
-    def unregister_background_service(self):            
-        success, status = systemd.unregister_service()
+    def _on_service_command_ready(self, result):
+        success, status = result
         if success:
             clipboard = self.app.clipboard()
             clipboard.setText(status)
             AlertDialog("Command copied to the clipboard. Please run it in your preferred Terminal application.", title="Set Background Service")
 
+    def _on_service_command_error(self, task_name: str, error_msg: str):
+        logger.error(f"Background service command {task_name} failed: {error_msg}")
+        self.tell(f"Unable to set background service: {error_msg}")
+        AlertDialog(f"Unable to set background service:\n{error_msg}", title="Set Background Service")
+
     def show(self):
         super().show()
+
+        # Only available once shown
+        window_handle = self.windowHandle()
+        if window_handle and not self._tracking_screen:
+            window_handle.screenChanged.connect(self._invalidate_screen_info)
+            self._tracking_screen = True
+
         self._adjust_app_size()
-        sys.exit(self.app.exec())
+        return self.app.exec()
 
     def closeEvent(self, event):
         logger.info("Application is closing. Shutting down procedure")
-        self.task_queue.stop()
-        
-        # Save root directory for repo backups
-        self.settings.set_save_root_dir(self.repos_backup_path)
-        
-        # Save state of each widget entry in the table
-        for entry in self.iter_entries():
-            repo_url = entry.url_label.text()
-            branches = entry.branches_to_pull
-            do_pull = entry.pull_checkbox.isChecked()
-            timestamp = entry.timestamp_label.text()
-            if timestamp in ["n/a", "Fetching..."] or not timestamp:
-                timestamp = ""
 
-            self.settings.save_repo(repo_url, do_pull=do_pull, timestamp=timestamp, branches=branches)
+        # Hide right away, the rest of the shutdown happens behind it. Geometry is taken first, hidden windows lose their frame
+        geometry = self.frameGeometry()
+        self.hide()
+
+        self.task_queue.stop(self.SHUTDOWN_WAIT_MS)
 
-        # Save the window size
-        width = self.frameGeometry().width()
-        height = self.frameGeometry().height() - 36
-        self.settings.save_window_size(width, height)
+        # The removed repositories are already gone from the settings, finish deleting them from disk
+        self._removal_executor.shutdown(wait=True)
 
-        self.settings.save_config()
+        # Clones that finished while waiting queued their results, apply them before saving
+        self.app.processEvents()
+        self._drain_completions()
         
+        self._flush_settings(geometry=geometry, in_background=True)
+
         logger.info("Shutdown")
         event.accept()
 
+    def _flush_settings(self, geometry: QRect = None, in_background: bool = False):
+        """Writes the current state of the window and table entries to disk. Runs only once per session.
+
+        :param geometry: Window frame geometry to save, the current one if not given.
+        :param in_background: Write the file on a separate thread, see `Settings.save_config`.
+        """
+        if self._settings_flushed:
+            return
+        self._settings_flushed = True
+
+        # Everything below is written to disk once, when the batch exits
+        with self.settings.batch(in_background=in_background):
+            # Save root directory for repo backups
+            self.settings.set_save_root_dir(self.repos_backup_path)
+        
+            # Save state of each widget entry in the table
+            batch = []
+            for entry in self.iter_entries():
+                timestamp = entry.get_timestamp()
+                if timestamp in ["n/a", "Fetching..."] or not timestamp:
+                    timestamp = ""
+
+                batch.append((entry.get_url(), entry.get_pull(), timestamp, entry.get_branches()))
+
+            self.settings.save_repos_bulk(batch)
+
+            # Save the window size
+            geometry = geometry or self.frameGeometry()
+            width = geometry.width()
+            height = geometry.height() - 36
+            self.settings.save_window_size(width, height)
+
+    def _invalidate_screen_info(self, *_):
+        self._screen_info = None
+
     def _adjust_app_size(self):
-        screen_info = get_screen_info(self.app)
+        if self._screen_info is None:
+            self._screen_info = get_screen_info(self.app)
+        screen_info = self._screen_info
 
         logger.debug(f"{screen_info=}")
 
@@ -754,6 +964,68 @@ class GitDatBackUI(QWidget):
             self.resize(QSize(650, 500))
 
 
+def clone_and_update_repo(url: str, do_pull: bool, branches: list, save_to: Path, shallow: bool = False,
+                          last_remote_head: str = "") -> tuple:
+    """Clones `url` into `save_to`, only the latest commit if `shallow`.
+
+    The clone is skipped when the remote branches, the saved branches and `shallow` are the same as
+    recorded by `last_remote_head` and the previous clone is still on disk.
+
+    Lives at module level and only takes plain values so that it can run in a process pool.
+
+    :return: `(url, do_pull, branches, timestamp, remote_head)` for the caller to stage into the settings.
+        `remote_head` is `None` if it should not be recorded.
+    """
+    repo = Repository(url)
+
+    remote_head = repo.get_remote_heads_fingerprint()
+    if remote_head:
+        # Changing the branches to pull or the clone depth also has to trigger a new clone
+        remote_head = hashlib.sha1(f"{remote_head}:{','.join(sorted(branches))}:{shallow}".encode("utf-8")).hexdigest()
+
+    if remote_head and remote_head == last_remote_head and repo.get_clone_dest(save_to).exists():
+        logger.info(f"[{url}] Remote unchanged since last pull, skipping clone")
+    else:
+        repo.clone_from(save_to, shallow=shallow, branches=branches)
+
+        if not repo.repo or not repo.branches_fetched:
+            # Clone or its branch fetch failed, don't let the next run skip it
+            remote_head = None
+
+    timestamp = QDateTime.currentDateTime().toString(TIMESTAMP_FORMAT)
+
+    return url, do_pull, branches, timestamp, remote_head or None
+
+
+def remove_directories(paths: list[Path], max_workers: int = MAX_CONCURRENT_TASKS) -> list[Path]:
+    """Removes the given directory trees concurrently. Paths that do not exist are skipped.
+
+    :return: The paths that could not be removed.
+    """
+    def _remove(path: Path):
+        # Let rmtree find out if it exists, saves a stat per path
+        try:
+            shutil.rmtree(path)
+        except FileNotFoundError:
+            return
+
+        logger.info(f"Removed directory {path}")
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_path = {executor.submit(_remove, path): path for path in paths}
+
+        for future in as_completed(future_to_path):
+            path = future_to_path[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error removing directory {path}: {e}")
+                failed.append(path)
+
+    return failed
+
+
 def clone_all_task(repo: Repository, to: Path):
     repo.clone_from(to)
     # repo.clone_branches()
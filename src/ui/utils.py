@@ -1,5 +1,4 @@
 from PySide6.QtWidgets import QApplication
-from urllib.parse import urlparse
 
 from log import create_logger
 from conf_globals import G_LOG_LEVEL
@@ -9,19 +8,16 @@ logger = create_logger(__name__, G_LOG_LEVEL)
 def get_screen_info(app: QApplication) -> tuple:
     # Get the primary screen
     screen = app.primaryScreen()
-    logger.debug(f"{screen=}")
 
     # Screen resolution
     size = screen.size()
     width = size.width()
     height = size.height()
-    
-    logger.debug(f"{size=}")
-    logger.debug(f"{width=}")
-    logger.debug(f"{height=}")
 
     # Scaling factor
     scale_f = screen.devicePixelRatio()
-    logger.debug(f"{scale_f=}")
+
+    # Lazy formatting, only built if debug is enabled
+    logger.debug("screen=%s size=%s width=%s height=%s scale_f=%s", screen, size, width, height, scale_f)
 
     return width, height, scale_f
@@ -1,4 +1,4 @@
-from .os_fs_paths import (system, win_get_documents_folder, win_get_appdata, win_get_localappdata,
+from .os_fs_paths import (system, get_config_folder, win_get_documents_folder, win_get_appdata, win_get_localappdata,
                           unix_get_config_folder, unix_get_local_folder, unix_get_share_folder, get_home_folder,
                           get_os_env_config_folder, get_env_tempdir, ensure_paths, get_system_drive, os_windows,
                           os_darwin, os_linux, send_to_clipboard, diff_files_in_dir)
@@ -1,5 +1,7 @@
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Union
 import platform
 import subprocess
 import shutil
@@ -14,80 +16,103 @@ UNIX = "unix"
 DARWIN = "darwin"
 MAC = "mac"
 
+_WINDOWS_NAMES = frozenset({WINDOWS})
+_LINUX_NAMES = frozenset({LINUX, UNIX})
+_DARWIN_NAMES = frozenset({DARWIN, MAC})
+
+# The platform does not change while running, platform.system() can be slow on Windows
+_SYSTEM = platform.system().lower()
+_IS_WINDOWS = _SYSTEM in _WINDOWS_NAMES
+_IS_LINUX = _SYSTEM in _LINUX_NAMES
+_IS_DARWIN = _SYSTEM in _DARWIN_NAMES
+_HOME = Path.home()
+
+_CLIPBOARD_CLIENT: str = None # Detected by _get_clipboard_client on first use
+
+
+# Folder kinds resolved for the running system, so no helper falls back through another
+_WINDOWS_FOLDERS = {
+    "appdata": lambda: Path(os.getenv("appdata")),
+    "localappdata": lambda: Path(os.getenv("localappdata")),
+    "documents": lambda: get_home_folder() / "Documents",
+    "share": lambda: Path(os.getenv("localappdata")),
+    "local": lambda: Path(os.getenv("localappdata")),
+    "config": lambda: Path(os.getenv("localappdata"))
+}
+_UNIX_FOLDERS = {
+    "appdata": lambda: get_home_folder() / ".local" / "share",
+    "localappdata": lambda: get_home_folder() / ".local" / "share",
+    "documents": lambda: get_home_folder() / ".local" / "share",
+    "share": lambda: get_home_folder() / ".local" / "share",
+    "local": lambda: get_home_folder() / ".local",
+    "config": lambda: get_home_folder() / ".config"
+}
+_FOLDER_FN = _WINDOWS_FOLDERS if _IS_WINDOWS else _UNIX_FOLDERS
+
+
+@lru_cache(maxsize=None)
+def get_config_folder(kind: str) -> Path:
+    """Returns the folder of the given kind for the running system.
+
+    :param kind: One of `appdata`, `localappdata`, `documents`, `share`, `local` or `config`
+    """
+    return _FOLDER_FN[kind]()
+
 
 def win_get_appdata() -> Path:
-    if os_windows():
-        return Path(os.getenv("appdata"))
-    else:
-        return unix_get_share_folder()
+    return get_config_folder("appdata")
 
 
 def win_get_localappdata() -> Path:
-    if os_windows():
-        return Path(os.getenv("localappdata"))
-    else:
-        return unix_get_share_folder()
+    return get_config_folder("localappdata")
 
 
 def win_get_documents_folder() -> Path:
-    if os_windows():
-        return get_home_folder() / "Documents"
-    else:
-        return unix_get_share_folder()
+    return get_config_folder("documents")
 
 
 def unix_get_share_folder() -> Path:
-    if not os_windows():
-        return unix_get_local_folder() / "share"
-    else:
-        return win_get_localappdata()
+    return get_config_folder("share")
 
 
 def unix_get_local_folder() -> Path:
-    if not os_windows():
-        return get_home_folder() / ".local"
-    else:
-        return win_get_localappdata()
+    return get_config_folder("local")
 
 
 def unix_get_config_folder() -> Path:
-    if not os_windows():
-        return get_home_folder() / ".config"
-    else:
-        return win_get_localappdata()
+    return get_config_folder("config")
 
 
 def get_home_folder() -> Path:
-    return Path(os.path.expanduser('~'))
+    return _HOME
 
 
+@lru_cache(maxsize=None)
 def get_env_tempdir() -> Path:
     if os_windows():
         _tempdir = win_get_localappdata() / "Temp"
     else:
         _tempdir = unix_get_share_folder() / "temp"
 
-    # Ensure path exists
+    # Ensure path exists, once as the result is cached
     ensure_paths(_tempdir)
 
     return _tempdir
 
 
+# Keyed by system(), Linux and MacOS write to user-writable locations, like ~/.local/share
+_CONFIG_FOLDER_FN = {
+    WINDOWS: win_get_localappdata,
+    LINUX: unix_get_share_folder,
+    UNIX: unix_get_share_folder,
+    DARWIN: unix_get_share_folder,
+    MAC: unix_get_share_folder
+}
+
+
 def get_os_env_config_folder() -> Path:
-    if os_windows():
-        log.info("Target System Windows")
-        _config_folder = win_get_localappdata()
-    elif os_linux():
-        log.info("Target System Linux/Unix")
-        _config_folder = unix_get_share_folder()
-    elif os_darwin():
-        log.info("Target System MacOS")
-        # Write to user-writable locations, like ~/.local/share
-        _config_folder = unix_get_share_folder()
-    else:
-        log.info("Target System Other")
-        log.info(system())
-        _config_folder = Path.cwd()
+    log.info(f"Target System {system()}")
+    _config_folder = _CONFIG_FOLDER_FN.get(_SYSTEM, Path.cwd)()
 
     ensure_paths(_config_folder)
     log.info(f"Config folder: {_config_folder}")
@@ -95,173 +120,152 @@ def get_os_env_config_folder() -> Path:
     return _config_folder
 
 
-def ensure_paths(to_path: Path):
-    if isinstance(to_path, Path):
-        if not to_path.exists():
-            if to_path.suffix:
-                # It's a file
-                os.makedirs(to_path.parent, exist_ok=True)
-                with open(to_path, 'w') as f:
-                    if to_path.suffix == ".json":
-                        f.write('{}')
-                    else:
-                        f.write('')
-            else:
-                # It's a directory
-                os.makedirs(to_path, exist_ok=True)
-    elif isinstance(to_path, str):
-        if not os.path.exists(to_path):
-            if str(to_path).rpartition('.')[-1]:
-                # We have a file
-                os.makedirs(to_path.rpartition('.')[0])
-                with open(to_path, 'w') as f:
-                    if to_path.endswith(".json") == ".json":
-                        f.write('{}')
-                    else:
-                        f.write('')
-            else:
-                os.makedirs(to_path)
-
-    return Path(to_path)
+def ensure_paths(to_path: Union[Path, str]) -> Path:
+    """Creates the folder, or the file and its parent folder if the path has a suffix. `.json` files start as `{}`."""
+    p = Path(to_path)
+
+    # Try to create first instead of checking, the paths usually exist already
+    folder = p.parent if p.suffix else p
+    try:
+        folder.mkdir()
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        folder.mkdir(parents=True, exist_ok=True)
+
+    if p.suffix:
+        try:
+            with open(p, 'x', encoding="utf-8") as f:
+                f.write('{}' if p.suffix == ".json" else '')
+        except FileExistsError:
+            pass
+
+    return p
 
 
+@lru_cache(maxsize=None)
 def get_system_drive() -> Path:
-    _drive = os.getenv("SystemDrive")
     if os_windows():
-        _drive += "/"
-    else:
-        _drive = get_home_folder()
-    return Path(_drive)
+        return Path(os.environ["SystemDrive"] + "/")
 
+    return get_home_folder()
 
-def get_temp_dir() -> Path:
-    if os_windows():
-        tmp_dir = Path(os.path.expandvars("%TEMP%"))
-    elif os_linux() or os_darwin():
-        tmp_dir = Path("/tmp")
-    else:
-        tmp_dir = Path(os.path.expanduser('~'))
 
-    return tmp_dir
+_TEMP_DIR_FN = {
+    WINDOWS: lambda: Path(os.path.expandvars("%TEMP%")),
+    LINUX: lambda: Path("/tmp"),
+    UNIX: lambda: Path("/tmp"),
+    DARWIN: lambda: Path("/tmp"),
+    MAC: lambda: Path("/tmp")
+}
+
+
+@lru_cache(maxsize=None)
+def get_temp_dir() -> Path:
+    return _TEMP_DIR_FN.get(_SYSTEM, lambda: Path(os.path.expanduser('~')))()
 
 
 def os_linux() -> bool:
-    return system() in [LINUX, UNIX]
+    return _IS_LINUX
 
 
 def os_darwin() -> bool:
-    return system() in [DARWIN, MAC]
+    return _IS_DARWIN
 
 
 def os_windows() -> bool:
-    return system() in [WINDOWS]
+    return _IS_WINDOWS
 
 
 def system() -> str:
-    return platform.system().lower()
+    return _SYSTEM
 
 
 def _get_clipboard_client() -> str:
     # In MacOS it's pbcopy
     # In Linux, it can be either xclip, xsel or both
+    global _CLIPBOARD_CLIENT
+
+    # Only probe once, the result does not change while running
+    if _CLIPBOARD_CLIENT:
+        return _CLIPBOARD_CLIENT
 
     clipboard_client = ''
 
     if os_linux():
-        # Try with xclip
-        log.info("Checking clipboard client xclip")
-        _clip = "xclip"
-
-        output = subprocess.run([_clip], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-        result = output.stdout.decode()
-
-        if "command not found" in result.lower():
-            log.warning(f"{_clip} is not an option")
-        else:
-            clipboard_client = _clip
-            log.info(f"{_clip} passed!")
-
-        # Try with xsel
-        if not clipboard_client:
-            _clip = "xsel"
-
+        # Try with xclip, then xsel
+        for _clip in ("xclip", "xsel"):
             log.info(f"Checking clipboard client {_clip}")
-            output = subprocess.run([_clip], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-            result = output.stdout.decode()
-
-            log.info(result)
-
-            if "command not found" in result.lower():
-                log.warning(f"{_clip} is not an option. Out of options...")
-            else:
+            if shutil.which(_clip):
                 clipboard_client = _clip
                 log.info(f"{_clip} passed!")
+                break
+            log.warning(f"{_clip} is not an option")
+        else:
+            log.warning("Out of options...")
     elif os_darwin():
         _clip = "pbcopy"
-        output = subprocess.run([_clip], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-        result = output.stdout.decode()
-
-        if "command not found" in result.lower():
-            log.warning(f"{_clip} is not an option. Out of options...")
-        else:
+        if shutil.which(_clip):
             clipboard_client = _clip
-
-        log.info(result)
+        else:
+            log.warning(f"{_clip} is not an option. Out of options...")
     elif os_windows():
         _clip = "clip"
         clipboard_client = _clip
     else:
         log.warning("Uh oh...")
 
-    return clipboard_client
+    _CLIPBOARD_CLIENT = clipboard_client
 
+    return clipboard_client
 
-def send_to_clipboard(content: str) -> None:
-    clipboard_client = _get_clipboard_client()
 
-    if not clipboard_client:
-        return
+# Arguments for each clipboard client to read the content from stdin
+_CLIPBOARD_COMMANDS = {
+    "xclip": ["xclip", "-selection", "clipboard"],
+    "xsel": ["xsel", "--clipboard", "--input"],
+    "pbcopy": ["pbcopy"],
+    "clip": ["clip"]
+}
 
-    temp_folder: Path = get_temp_dir() / ".temp_clipboard"
-    temp_file: Path = temp_folder / ".temp_clipboard.txt"
 
-    # Ensure path is created
-    os.makedirs(temp_folder, exist_ok=True)
+def send_to_clipboard(content: str) -> None:
+    # With a running Qt application, use its clipboard directly
+    try:
+        from PySide6.QtGui import QGuiApplication
+    except ImportError:
+        QGuiApplication = None
 
-    with open(temp_file, 'w', encoding="utf-8") as tf:
-        tf.write(str(content))
+    if QGuiApplication is not None and QGuiApplication.instance() is not None:
+        QGuiApplication.clipboard().setText(str(content))
+        log.info("Contents copied to clipboard!")
+        return
 
-    if not os_windows():
-        command = [clipboard_client, "-sel", "clip <", str(temp_file)]
-    else:
-        command = f"{clipboard_client} < {str(temp_file)}"
+    # Fallback to a clipboard client, fed through stdin
+    clipboard_client = _get_clipboard_client()
 
-    if not command:
-        # Delete the temp file and folder
-        log.info(f"Deleting {temp_folder}")
-        shutil.rmtree(temp_folder, ignore_errors=True)
+    if not clipboard_client:
         return
 
+    command = _CLIPBOARD_COMMANDS.get(clipboard_client, [clipboard_client])
+
     try:
-        subprocess.run(command)
+        subprocess.run(command, input=str(content).encode("utf-8"))
     except Exception as e:
         log.error(e)
+        return
 
-    # Delete the temp file and folder
-    log.info(f"Deleting {temp_folder}")
-    shutil.rmtree(temp_folder, ignore_errors=True)
-
-    log.info(f"\nContents copied to clipboard!")
+    log.info("Contents copied to clipboard!")
 
 
 def diff_files_in_dir(in_dir: Path, against: list) -> list[Path]:
-    _diff = []
+    in_dir = Path(in_dir)
 
-    for fs_iter in in_dir.iterdir():
-        print(f"{fs_iter} in _checked_out: {fs_iter in against}")
+    # Only the entries directly in in_dir can match, compare by name
+    against_names = {_p.name for _p in map(Path, against) if _p.parent == in_dir}
 
-        if fs_iter not in against:
-            _diff.append(Path(fs_iter))
+    with os.scandir(in_dir) as it:
+        _diff = [in_dir / entry.name for entry in it if entry.name not in against_names]
 
     log.info(f"Diff of {against}")
     for diff in _diff: